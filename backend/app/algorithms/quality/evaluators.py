@@ -10,37 +10,26 @@ The ``context`` dict may contain:
 - ``num_days`` (int): number of days
 """
 
-import math
+import bisect
 import re
 from abc import ABC, abstractmethod
 from collections import Counter
-from datetime import time
+from datetime import date, time
 from typing import Any
 
 from app.algorithms.quality.models import EvaluatorResult
+from app.algorithms.tsp import haversine_meters
 from app.models.day_plan import Activity, DayPlan
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-_HAVERSINE_R = 6_371.0  # Earth radius in km
-
-
 def _haversine_km(
     lat1: float, lng1: float, lat2: float, lng2: float
 ) -> float:
     """Haversine distance in kilometres between two lat/lng pairs."""
-    lat1_r = math.radians(lat1)
-    lat2_r = math.radians(lat2)
-    d_lat = math.radians(lat2 - lat1)
-    d_lng = math.radians(lng2 - lng1)
-    a = (
-        math.sin(d_lat / 2) ** 2
-        + math.cos(lat1_r) * math.cos(lat2_r) * math.sin(d_lng / 2) ** 2
-    )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return _HAVERSINE_R * c
+    return haversine_meters(lat1, lng1, lat2, lng2) / 1000
 
 
 def _parse_time(time_str: str) -> time | None:
@@ -52,34 +41,40 @@ def _parse_time(time_str: str) -> time | None:
         return None
 
 
+def _lower_categories(activities: list[Activity]) -> list[str]:
+    """Lowercased place category per activity (``""`` when missing).
+
+    Computed once per day so evaluators don't re-lowercase the same
+    category strings inside their per-activity checks.
+    """
+    return [a.place.category.lower() if a.place.category else "" for a in activities]
+
+
 def _in_window(t: time, window: tuple[time, time]) -> bool:
     """Return True if *t* falls within *window* (inclusive)."""
     return window[0] <= t <= window[1]
 
 
+def _letter_grade(
+    score: float, thresholds: tuple[float, ...], grades: tuple[str, ...]
+) -> str:
+    """Map a 0-100 score onto a grade scale.
+
+    *thresholds* are ascending lower bounds and ``grades[i]`` applies below
+    ``thresholds[i]``, so *grades* has one more entry than *thresholds*.
+    """
+    return grades[bisect.bisect_right(thresholds, score)]
+
+
+_GRADE_THRESHOLDS: tuple[float, ...] = (50, 55, 60, 65, 70, 75, 80, 85, 90, 95)
+_GRADES: tuple[str, ...] = (
+    "F", "D", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+",
+)
+
+
 def _grade_from_score(score: float) -> str:
-    """Map a 0-100 score to a letter grade."""
-    if score >= 95:
-        return "A+"
-    if score >= 90:
-        return "A"
-    if score >= 85:
-        return "A-"
-    if score >= 80:
-        return "B+"
-    if score >= 75:
-        return "B"
-    if score >= 70:
-        return "B-"
-    if score >= 65:
-        return "C+"
-    if score >= 60:
-        return "C"
-    if score >= 55:
-        return "C-"
-    if score >= 50:
-        return "D"
-    return "F"
+    """Map a 0-100 score to a per-evaluator letter grade."""
+    return _letter_grade(score, _GRADE_THRESHOLDS, _GRADES)
 
 
 # ---------------------------------------------------------------------------
@@ -199,13 +194,16 @@ class MealTimingEvaluator(BaseEvaluator):
 
         dining = [
             a
-            for a in day.activities
-            if (a.place.category.lower() if a.place.category else "") in _DINING_CATEGORIES
+            for a, cat in zip(day.activities, _lower_categories(day.activities))
+            if cat in _DINING_CATEGORIES
         ]
 
+        # Start times parsed once and shared by the lunch and dinner lookups
+        dining_starts = [(a, _parse_time(a.time_start)) for a in dining]
+
         # Check 1: Has lunch?
         result["total_checks"] += 1
-        lunch = self._find_meal_in_window(dining, lunch_acceptable)
+        lunch = self._find_meal_in_window(dining_starts, lunch_acceptable)
         if lunch:
             result["passed_checks"] += 1
         else:
@@ -215,7 +213,7 @@ class MealTimingEvaluator(BaseEvaluator):
 
         # Check 2: Has dinner?
         result["total_checks"] += 1
-        dinner = self._find_meal_in_window(dining, dinner_acceptable)
+        dinner = self._find_meal_in_window(dining_starts, dinner_acceptable)
         if dinner:
             result["passed_checks"] += 1
         else:
@@ -260,10 +258,11 @@ class MealTimingEvaluator(BaseEvaluator):
         return result
 
     def _find_meal_in_window(
-        self, dining: list[Activity], window: tuple[time, time]
+        self,
+        dining_starts: list[tuple[Activity, time | None]],
+        window: tuple[time, time],
     ) -> Activity | None:
-        for a in dining:
-            t = _parse_time(a.time_start)
+        for a, t in dining_starts:
             if t and _in_window(t, window):
                 return a
         return None
@@ -365,7 +364,7 @@ class GeographicClusteringEvaluator(BaseEvaluator):
                     f"'{day.activities[i + 1].place.name}'"
                 )
 
-        backtracking = self._detect_backtracking(locations)
+        backtracking = self._detect_backtracking(locations, distances)
         if backtracking > 0:
             issues.append(
                 f"Day {day.day_number}: Detected {backtracking} potential "
@@ -413,19 +412,25 @@ class GeographicClusteringEvaluator(BaseEvaluator):
     @staticmethod
     def _detect_backtracking(
         locations: list[tuple[float, float]],
+        leg_distances: list[float],
     ) -> int:
+        """Count A→B→C hops that end near A.
+
+        ``leg_distances[i]`` is the km distance from ``locations[i]`` to
+        ``locations[i + 1]``, already computed by the caller, so only the
+        A→C chord needs a new haversine call.
+        """
         if len(locations) < 3:
             return 0
         threshold_km = 1.0
         count = 0
         for i in range(len(locations) - 2):
-            lat1, lng1 = locations[i]
-            lat2, lng2 = locations[i + 1]
-            lat3, lng3 = locations[i + 2]
-            d1 = _haversine_km(lat1, lng1, lat2, lng2)
-            d2 = _haversine_km(lat2, lng2, lat3, lng3)
+            d1 = leg_distances[i]
+            d2 = leg_distances[i + 1]
             if d1 < threshold_km or d2 < threshold_km:
                 continue
+            lat1, lng1 = locations[i]
+            lat3, lng3 = locations[i + 2]
             d_start_end = _haversine_km(lat1, lng1, lat3, lng3)
             total_travel = d1 + d2
             if total_travel > 0 and d_start_end / total_travel < 0.25:
@@ -542,6 +547,13 @@ CATEGORY_GROUPS: dict[str, set[str]] = {
     "landmark": {"tourist_attraction", "attraction", "landmark", "monument", "fort", "palace"},
 }
 
+# Flattened category -> group index so classification is one dict lookup
+# instead of a scan over every group set.  First group listed wins.
+_CATEGORY_TO_GROUP: dict[str, str] = {}
+for _group, _group_cats in CATEGORY_GROUPS.items():
+    for _cat in _group_cats:
+        _CATEGORY_TO_GROUP.setdefault(_cat, _group)
+
 
 class VarietyEvaluator(BaseEvaluator):
     """
@@ -620,13 +632,12 @@ class VarietyEvaluator(BaseEvaluator):
         if not day.activities:
             return score, categories, groups_found, issues
 
-        for a in day.activities:
-            cat = a.place.category.lower() if a.place.category else "other"
+        for cat in _lower_categories(day.activities):
+            cat = cat or "other"
             categories.append(cat)
-            for group, group_cats in CATEGORY_GROUPS.items():
-                if cat in group_cats:
-                    groups_found.add(group)
-                    break
+            group = _CATEGORY_TO_GROUP.get(cat)
+            if group:
+                groups_found.add(group)
 
         cat_counts = Counter(categories)
         non_dining = [
@@ -656,6 +667,24 @@ class VarietyEvaluator(BaseEvaluator):
 # 5. Opening Hours Evaluator
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Lowercased names that identify a weekday's line in Google opening hours
+_DAY_NAMES: dict[str, tuple[str, ...]] = {
+    "Mon": ("mon", "monday"),
+    "Tue": ("tue", "tuesday"),
+    "Wed": ("wed", "wednesday"),
+    "Thu": ("thu", "thursday"),
+    "Fri": ("fri", "friday"),
+    "Sat": ("sat", "saturday"),
+    "Sun": ("sun", "sunday"),
+}
+
+_HOURS_RANGE_RE = re.compile(
+    r"(\d{1,2}):?(\d{2})?\s*(am|pm)?\s*[-\u2013]\s*"
+    r"(\d{1,2}):?(\d{2})?\s*(am|pm)?",
+    re.IGNORECASE,
+)
+
+
 class OpeningHoursEvaluator(BaseEvaluator):
     """
     Evaluates if activities are scheduled when places are open.
@@ -686,8 +715,9 @@ class OpeningHoursEvaluator(BaseEvaluator):
         valid = 0
 
         for day in day_plans:
+            day_abbrev = self._day_abbrev(day.date)
             for activity in day.activities:
-                status, issue = self._check_activity(activity, day.date)
+                status, issue = self._check_activity(activity, day_abbrev)
                 total_checked += 1
                 if status in ("valid", "unknown"):
                     valid += 1
@@ -700,8 +730,18 @@ class OpeningHoursEvaluator(BaseEvaluator):
             name=self.name, score=score, grade=_grade_from_score(score), issues=issues
         )
 
+    @staticmethod
+    def _day_abbrev(date_str: str | None) -> str | None:
+        """Weekday abbreviation (``"Mon"``) for an ISO date, once per day."""
+        if not date_str:
+            return None
+        try:
+            return date.fromisoformat(date_str).strftime("%a")
+        except (ValueError, TypeError):
+            return None
+
     def _check_activity(
-        self, activity: Activity, date_str: str | None
+        self, activity: Activity, day_abbrev: str | None
     ) -> tuple[str, str | None]:
         opening_hours = activity.place.opening_hours
         if not opening_hours:
@@ -711,16 +751,7 @@ class OpeningHoursEvaluator(BaseEvaluator):
         if not activity_time:
             return "unknown", None
 
-        if not date_str:
-            return "unknown", None
-
-        # Derive day abbreviation from date string
-        try:
-            from datetime import date as _date
-
-            d = _date.fromisoformat(date_str)
-            day_abbrev = d.strftime("%a")
-        except (ValueError, TypeError):
+        if not day_abbrev:
             return "unknown", None
 
         day_hours = self._find_day_hours(opening_hours, day_abbrev)
@@ -772,33 +803,20 @@ class OpeningHoursEvaluator(BaseEvaluator):
     def _find_day_hours(
         opening_hours: list[str], day_abbrev: str
     ) -> list[tuple[time, time]] | str | None:
-        day_map = {
-            "Mon": ["Mon", "Monday"],
-            "Tue": ["Tue", "Tuesday"],
-            "Wed": ["Wed", "Wednesday"],
-            "Thu": ["Thu", "Thursday"],
-            "Fri": ["Fri", "Friday"],
-            "Sat": ["Sat", "Saturday"],
-            "Sun": ["Sun", "Sunday"],
-        }
-        day_names = day_map.get(day_abbrev, [day_abbrev])
+        day_names = _DAY_NAMES.get(day_abbrev, (day_abbrev.lower(),))
 
         windows: list[tuple[time, time]] = []
         is_closed = False
 
         for hs in opening_hours:
             hs_lower = hs.lower()
-            if not any(n.lower() in hs_lower for n in day_names):
+            if not any(n in hs_lower for n in day_names):
                 continue
             if "closed" in hs_lower:
                 is_closed = True
                 continue
 
-            pattern = (
-                r"(\d{1,2}):?(\d{2})?\s*(am|pm)?\s*[-\u2013]\s*"
-                r"(\d{1,2}):?(\d{2})?\s*(am|pm)?"
-            )
-            match = re.search(pattern, hs, re.IGNORECASE)
+            match = _HOURS_RANGE_RE.search(hs)
             if match:
                 oh = int(match.group(1))
                 om = int(match.group(2) or 0)
@@ -911,19 +929,19 @@ class ThemeAlignmentEvaluator(BaseEvaluator):
             return 70.0, issues
 
         non_dining = [
-            a
-            for a in day.activities
-            if (a.place.category.lower() if a.place.category else "")
-            not in {"dining", "restaurant", "cafe", "food"}
+            (a, cat)
+            for a, cat in zip(day.activities, _lower_categories(day.activities))
+            if cat not in _DINING_CATEGORIES
         ]
         if not non_dining:
             return 100.0, issues
 
+        # One C-level regex scan per name instead of one substring scan
+        # per expected keyword.
+        keyword_re = re.compile("|".join(map(re.escape, sorted(expected))))
         matching = 0
-        for a in non_dining:
-            cat = a.place.category.lower() if a.place.category else ""
-            name_lower = a.place.name.lower()
-            if cat in expected or any(kw in name_lower for kw in expected):
+        for a, cat in non_dining:
+            if cat in expected or keyword_re.search(a.place.name.lower()):
                 matching += 1
 
         alignment = (matching / len(non_dining)) * 100
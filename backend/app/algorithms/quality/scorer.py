@@ -17,6 +17,7 @@ from app.algorithms.quality.evaluators import (
     ThemeAlignmentEvaluator,
     TravelEfficiencyEvaluator,
     VarietyEvaluator,
+    _letter_grade,
 )
 from app.algorithms.quality.models import EvaluatorResult
 from app.models.day_plan import DayPlan
@@ -27,23 +28,13 @@ logger = logging.getLogger(__name__)
 # Grade scale: A (90+), A- (85+), B+ (80+), B (75+), B- (70+),
 #              C+ (65+), C (60+), D (below 60)
 
-_GRADE_THRESHOLDS: list[tuple[float, str]] = [
-    (90, "A"),
-    (85, "A-"),
-    (80, "B+"),
-    (75, "B"),
-    (70, "B-"),
-    (65, "C+"),
-    (60, "C"),
-]
+_GRADE_THRESHOLDS: tuple[float, ...] = (60, 65, 70, 75, 80, 85, 90)
+_GRADES: tuple[str, ...] = ("D", "C", "C+", "B-", "B", "B+", "A-", "A")
 
 
 def _grade_from_score(score: float) -> str:
-    """Map a 0-100 score to a letter grade."""
-    for threshold, grade in _GRADE_THRESHOLDS:
-        if score >= threshold:
-            return grade
-    return "D"
+    """Map a 0-100 score to an overall letter grade."""
+    return _letter_grade(score, _GRADE_THRESHOLDS, _GRADES)
 
 
 class ItineraryScorer:
@@ -74,6 +65,10 @@ class ItineraryScorer:
             ThemeAlignmentEvaluator(),
             DurationAppropriatenessEvaluator(),
         ]
+        # Evaluator weights are fixed, so look them up by name once and
+        # keep their sum as an invariant (1.0)
+        self._weights = {ev.name: ev.weight for ev in self.evaluators}
+        self.total_weight = sum(self._weights.values())
 
     def evaluate(
         self,
@@ -125,7 +120,6 @@ class ItineraryScorer:
         # Collect issues and recommendations
         all_issues: list[str] = []
         critical_issues: list[str] = []
-        recommendations: list[str] = []
 
         for r in evaluator_results:
             all_issues.extend(r.issues)
@@ -145,11 +139,13 @@ class ItineraryScorer:
                 )
             )
 
-        # Prioritise recommendations from lowest-scoring metrics
-        for r in sorted(evaluator_results, key=lambda x: x.score):
-            for issue in r.issues:
-                if issue not in recommendations:
-                    recommendations.append(issue)
+        # Prioritise recommendations from lowest-scoring metrics; dict keys
+        # de-duplicate in first-seen order without a list scan per issue.
+        recommendations = list(dict.fromkeys(
+            issue
+            for r in sorted(evaluator_results, key=lambda x: x.score)
+            for issue in r.issues
+        ))
 
         report = QualityReport(
             overall_score=round(overall_score, 1),
@@ -175,25 +171,16 @@ class ItineraryScorer:
         if not results:
             return 0.0
 
-        # Use the weight from each evaluator instance
         total_weight = 0.0
         weighted_sum = 0.0
 
         for r in results:
-            # Look up the evaluator's weight by name
-            w = self._weight_for(r.name)
+            w = self._weights.get(r.name, 0.1)  # 0.1 fallback for unknown names
             weighted_sum += r.score * w
             total_weight += w
 
         return weighted_sum / total_weight if total_weight else 0.0
 
-    def _weight_for(self, name: str) -> float:
-        """Get the weight for an evaluator by its name."""
-        for ev in self.evaluators:
-            if ev.name == name:
-                return ev.weight
-        return 0.1  # fallback
-
     def get_quick_score(
         self,
         day_plans: list[DayPlan],
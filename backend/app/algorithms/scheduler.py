@@ -21,6 +21,10 @@ logger = logging.getLogger(__name__)
 # Day-name abbreviations for formatting opening hours (Google format: 0=Sunday)
 _OH_DAY_NAMES = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
 
+# Pre-formatted "HH:MM" strings indexed by minute of day, so activity
+# time slots are a list lookup instead of a strftime call.
+_HHMM_STRS: list[str] = [f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60)]
+
 # Use the single consolidated duration map from config
 DURATION_BY_CATEGORY = DURATION_BY_TYPE
 
@@ -29,6 +33,11 @@ PACE_MULTIPLIERS: dict[Pace, float] = {
 }
 
 
+def _format_hhmm(dt: datetime | time) -> str:
+    """Format a datetime/time as ``HH:MM`` via the precomputed table."""
+    return _HHMM_STRS[dt.hour * 60 + dt.minute]
+
+
 def _parse_time_str(time_str: str) -> time:
     """Parse HH:MM time string to time object."""
     parts = time_str.split(":")
@@ -39,6 +48,163 @@ def _parse_time_str(time_str: str) -> time:
 _MEAL_TYPES: set[str] = _DINING_TYPES_SET
 
 
+# Regional meal-window profiles: (countries, ScheduleConfig overrides).
+# Broad regional patterns rather than a per-country database.
+_REGIONAL_MEAL_PROFILES: list[tuple[tuple[str, ...], dict[str, time]]] = [
+    # Late-dining cultures (Spain, Portugal, Argentina, Greece, Italy)
+    (
+        ("spain", "portugal", "argentina", "greece", "italy"),
+        {
+            "lunch_window_start": time(13, 30),
+            "lunch_window_end": time(15, 30),
+            "dinner_window_start": time(20, 0),
+            "dinner_window_end": time(22, 30),
+            "lunch_target": time(14, 0),
+            "dinner_target": time(21, 0),
+        },
+    ),
+    # Early-dining cultures (Japan, Korea, parts of SE Asia)
+    (
+        ("japan", "south korea", "korea", "taiwan"),
+        {
+            "lunch_window_start": time(11, 30),
+            "lunch_window_end": time(13, 30),
+            "dinner_window_start": time(17, 30),
+            "dinner_window_end": time(20, 0),
+            "lunch_target": time(12, 0),
+            "dinner_target": time(18, 30),
+        },
+    ),
+    # South Asian patterns (India, Sri Lanka, Nepal)
+    (
+        ("india", "sri lanka", "nepal", "bangladesh", "pakistan"),
+        {
+            "lunch_window_start": time(12, 30),
+            "lunch_window_end": time(14, 30),
+            "dinner_window_start": time(19, 30),
+            "dinner_window_end": time(21, 30),
+            "lunch_target": time(13, 0),
+            "dinner_target": time(20, 0),
+        },
+    ),
+    # Middle Eastern patterns (late lunch, late dinner)
+    (
+        ("turkey", "iran", "iraq", "lebanon", "syria", "jordan",
+         "saudi arabia", "uae", "united arab emirates", "qatar", "bahrain",
+         "kuwait", "oman", "egypt"),
+        {
+            "lunch_window_start": time(13, 0),
+            "lunch_window_end": time(15, 0),
+            "dinner_window_start": time(19, 0),
+            "dinner_window_end": time(22, 0),
+            "lunch_target": time(13, 30),
+            "dinner_target": time(20, 0),
+        },
+    ),
+    # China and Vietnam (early and structured meals)
+    (
+        ("china", "vietnam", "hong kong", "macau"),
+        {
+            "lunch_window_start": time(11, 30),
+            "lunch_window_end": time(13, 0),
+            "dinner_window_start": time(17, 30),
+            "dinner_window_end": time(19, 30),
+            "lunch_target": time(12, 0),
+            "dinner_target": time(18, 0),
+        },
+    ),
+    # Southeast Asian patterns (flexible, many snack meals)
+    (
+        ("thailand", "malaysia", "indonesia", "philippines", "singapore",
+         "myanmar", "cambodia", "laos"),
+        {
+            "lunch_window_start": time(11, 30),
+            "lunch_window_end": time(13, 30),
+            "dinner_window_start": time(18, 0),
+            "dinner_window_end": time(20, 30),
+            "lunch_target": time(12, 0),
+            "dinner_target": time(18, 30),
+        },
+    ),
+    # Northern/Central European (early dinner)
+    (
+        ("germany", "austria", "switzerland", "netherlands", "belgium",
+         "denmark", "sweden", "norway", "finland", "iceland", "poland",
+         "czech republic", "czechia", "hungary", "slovakia"),
+        {
+            "lunch_window_start": time(12, 0),
+            "lunch_window_end": time(13, 30),
+            "dinner_window_start": time(18, 0),
+            "dinner_window_end": time(20, 0),
+            "lunch_target": time(12, 30),
+            "dinner_target": time(18, 30),
+        },
+    ),
+    # Eastern European patterns
+    (
+        ("russia", "ukraine", "romania", "bulgaria", "serbia", "croatia",
+         "slovenia", "bosnia", "montenegro", "albania", "north macedonia",
+         "georgia", "armenia", "azerbaijan"),
+        {
+            "lunch_window_start": time(12, 30),
+            "lunch_window_end": time(14, 0),
+            "dinner_window_start": time(19, 0),
+            "dinner_window_end": time(21, 0),
+            "lunch_target": time(13, 0),
+            "dinner_target": time(19, 30),
+        },
+    ),
+    # Latin American patterns (late meals, similar to Spain)
+    (
+        ("mexico", "colombia", "peru", "chile", "brazil", "ecuador",
+         "bolivia", "venezuela", "uruguay", "paraguay", "costa rica",
+         "panama", "cuba", "dominican republic"),
+        {
+            "lunch_window_start": time(13, 0),
+            "lunch_window_end": time(15, 0),
+            "dinner_window_start": time(19, 30),
+            "dinner_window_end": time(22, 0),
+            "lunch_target": time(13, 30),
+            "dinner_target": time(20, 30),
+        },
+    ),
+    # African patterns (varied, moderate defaults)
+    (
+        ("south africa", "kenya", "tanzania", "morocco", "tunisia",
+         "ethiopia", "ghana", "nigeria", "senegal", "uganda", "rwanda",
+         "mozambique", "namibia", "botswana"),
+        {
+            "lunch_window_start": time(12, 0),
+            "lunch_window_end": time(14, 0),
+            "dinner_window_start": time(18, 30),
+            "dinner_window_end": time(21, 0),
+            "lunch_target": time(12, 30),
+            "dinner_target": time(19, 0),
+        },
+    ),
+    # Australia / New Zealand (early dinner)
+    (
+        ("australia", "new zealand"),
+        {
+            "lunch_window_start": time(12, 0),
+            "lunch_window_end": time(13, 30),
+            "dinner_window_start": time(18, 0),
+            "dinner_window_end": time(20, 0),
+            "lunch_target": time(12, 30),
+            "dinner_target": time(18, 30),
+        },
+    ),
+]
+
+# Country -> overrides, flattened once at import so for_region() is a
+# single dict lookup instead of walking the regional if-chain.
+_MEAL_WINDOWS_BY_COUNTRY: dict[str, dict[str, time]] = {
+    country: overrides
+    for countries, overrides in _REGIONAL_MEAL_PROFILES
+    for country in countries
+}
+
+
 @dataclass
 class ScheduleConfig:
     """Configuration for schedule building.
@@ -69,143 +235,11 @@ class ScheduleConfig:
         The LLM day planner already suggests culture-appropriate meal
         times; this ensures the scheduler doesn't penalize them.
         """
-        c = country.lower().strip()
-
-        # Late-dining cultures (Spain, Portugal, Argentina, Greece, Italy)
-        if c in ("spain", "portugal", "argentina", "greece", "italy"):
-            return cls(
-                lunch_window_start=time(13, 30),
-                lunch_window_end=time(15, 30),
-                dinner_window_start=time(20, 0),
-                dinner_window_end=time(22, 30),
-                lunch_target=time(14, 0),
-                dinner_target=time(21, 0),
-            )
-
-        # Early-dining cultures (Japan, Korea, parts of SE Asia)
-        if c in ("japan", "south korea", "korea", "taiwan"):
-            return cls(
-                lunch_window_start=time(11, 30),
-                lunch_window_end=time(13, 30),
-                dinner_window_start=time(17, 30),
-                dinner_window_end=time(20, 0),
-                lunch_target=time(12, 0),
-                dinner_target=time(18, 30),
-            )
-
-        # South Asian patterns (India, Sri Lanka, Nepal)
-        if c in ("india", "sri lanka", "nepal", "bangladesh", "pakistan"):
-            return cls(
-                lunch_window_start=time(12, 30),
-                lunch_window_end=time(14, 30),
-                dinner_window_start=time(19, 30),
-                dinner_window_end=time(21, 30),
-                lunch_target=time(13, 0),
-                dinner_target=time(20, 0),
-            )
-
-        # Middle Eastern patterns (late lunch, late dinner)
-        if c in ("turkey", "iran", "iraq", "lebanon", "syria", "jordan",
-                 "saudi arabia", "uae", "united arab emirates", "qatar",
-                 "bahrain", "kuwait", "oman", "egypt"):
-            return cls(
-                lunch_window_start=time(13, 0),
-                lunch_window_end=time(15, 0),
-                dinner_window_start=time(19, 0),
-                dinner_window_end=time(22, 0),
-                lunch_target=time(13, 30),
-                dinner_target=time(20, 0),
-            )
-
-        # China and Vietnam (early and structured meals)
-        if c in ("china", "vietnam", "hong kong", "macau"):
-            return cls(
-                lunch_window_start=time(11, 30),
-                lunch_window_end=time(13, 0),
-                dinner_window_start=time(17, 30),
-                dinner_window_end=time(19, 30),
-                lunch_target=time(12, 0),
-                dinner_target=time(18, 0),
-            )
-
-        # Southeast Asian patterns (flexible, many snack meals)
-        if c in ("thailand", "malaysia", "indonesia", "philippines",
-                 "singapore", "myanmar", "cambodia", "laos"):
-            return cls(
-                lunch_window_start=time(11, 30),
-                lunch_window_end=time(13, 30),
-                dinner_window_start=time(18, 0),
-                dinner_window_end=time(20, 30),
-                lunch_target=time(12, 0),
-                dinner_target=time(18, 30),
-            )
-
-        # Northern/Central European (early dinner)
-        if c in ("germany", "austria", "switzerland", "netherlands",
-                 "belgium", "denmark", "sweden", "norway", "finland",
-                 "iceland", "poland", "czech republic", "czechia",
-                 "hungary", "slovakia"):
-            return cls(
-                lunch_window_start=time(12, 0),
-                lunch_window_end=time(13, 30),
-                dinner_window_start=time(18, 0),
-                dinner_window_end=time(20, 0),
-                lunch_target=time(12, 30),
-                dinner_target=time(18, 30),
-            )
-
-        # Eastern European patterns
-        if c in ("russia", "ukraine", "romania", "bulgaria", "serbia",
-                 "croatia", "slovenia", "bosnia", "montenegro", "albania",
-                 "north macedonia", "georgia", "armenia", "azerbaijan"):
-            return cls(
-                lunch_window_start=time(12, 30),
-                lunch_window_end=time(14, 0),
-                dinner_window_start=time(19, 0),
-                dinner_window_end=time(21, 0),
-                lunch_target=time(13, 0),
-                dinner_target=time(19, 30),
-            )
-
-        # Latin American patterns (late meals, similar to Spain)
-        if c in ("mexico", "colombia", "peru", "chile", "brazil",
-                 "ecuador", "bolivia", "venezuela", "uruguay", "paraguay",
-                 "costa rica", "panama", "cuba", "dominican republic"):
-            return cls(
-                lunch_window_start=time(13, 0),
-                lunch_window_end=time(15, 0),
-                dinner_window_start=time(19, 30),
-                dinner_window_end=time(22, 0),
-                lunch_target=time(13, 30),
-                dinner_target=time(20, 30),
-            )
-
-        # African patterns (varied, moderate defaults)
-        if c in ("south africa", "kenya", "tanzania", "morocco",
-                 "tunisia", "ethiopia", "ghana", "nigeria", "senegal",
-                 "uganda", "rwanda", "mozambique", "namibia", "botswana"):
-            return cls(
-                lunch_window_start=time(12, 0),
-                lunch_window_end=time(14, 0),
-                dinner_window_start=time(18, 30),
-                dinner_window_end=time(21, 0),
-                lunch_target=time(12, 30),
-                dinner_target=time(19, 0),
-            )
-
-        # Australia / New Zealand (early dinner)
-        if c in ("australia", "new zealand"):
-            return cls(
-                lunch_window_start=time(12, 0),
-                lunch_window_end=time(13, 30),
-                dinner_window_start=time(18, 0),
-                dinner_window_end=time(20, 0),
-                lunch_target=time(12, 30),
-                dinner_target=time(18, 30),
-            )
-
-        # Default international windows
-        return cls()
+        overrides = _MEAL_WINDOWS_BY_COUNTRY.get(country.lower().strip())
+        if overrides is None:
+            # Default international windows
+            return cls()
+        return cls(**overrides)
 
     @classmethod
     def from_context(
@@ -436,8 +470,8 @@ class ScheduleBuilder:
 
             schedule.append(
                 Activity(
-                    time_start=current_time.strftime("%H:%M"),
-                    time_end=end_time.strftime("%H:%M"),
+                    time_start=_format_hhmm(current_time),
+                    time_end=_format_hhmm(end_time),
                     duration_minutes=duration,
                     place=activity_place,
                     route_to_next=route_to_next,
@@ -19,6 +19,34 @@ logger = logging.getLogger(__name__)
 # Haversine utility
 # ---------------------------------------------------------------------------
 
+EARTH_RADIUS_M = 6_371_000
+_DEG_TO_RAD = math.pi / 180
+
+
+def haversine_meters(
+    lat1: float, lng1: float, lat2: float, lng2: float
+) -> float:
+    """
+    Haversine distance between two lat/lng pairs.
+
+    Single implementation shared by the route optimizer, quality
+    evaluators and the planning fallbacks.
+
+    Returns:
+        Distance in meters.
+    """
+    # Degree scaling and squaring are done inline (no radians() calls or
+    # ** 2) since this runs once per pair in the evaluators and fallbacks.
+    sin_dlat = math.sin((lat2 - lat1) * _DEG_TO_RAD / 2)
+    sin_dlng = math.sin((lng2 - lng1) * _DEG_TO_RAD / 2)
+    a = (
+        sin_dlat * sin_dlat
+        + math.cos(lat1 * _DEG_TO_RAD) * math.cos(lat2 * _DEG_TO_RAD)
+        * sin_dlng * sin_dlng
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(1.0, a)))
+
+
 def haversine_distance(loc1: Location, loc2: Location) -> float:
     """
     Calculate distance between two Location objects using the Haversine formula.
@@ -30,18 +58,100 @@ def haversine_distance(loc1: Location, loc2: Location) -> float:
     Returns:
         Distance in meters.
     """
-    R = 6_371_000  # Earth's radius in metres
-    lat1_rad = math.radians(loc1.lat)
-    lat2_rad = math.radians(loc2.lat)
-    delta_lat = math.radians(loc2.lat - loc1.lat)
-    delta_lng = math.radians(loc2.lng - loc1.lng)
+    return haversine_meters(loc1.lat, loc1.lng, loc2.lat, loc2.lng)
 
-    a = (
-        math.sin(delta_lat / 2) ** 2
-        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng / 2) ** 2
+
+def _wrap_lng_delta(dlng: float) -> float:
+    """Wrap a longitude difference in radians to [-pi, pi)."""
+    return (dlng + math.pi) % (2 * math.pi) - math.pi
+
+
+def fast_distance(loc1: Location, loc2: Location) -> float:
+    """
+    Approximate distance using an equirectangular projection.
+
+    Accurate to well under 1% for intra-city distances (< ~20 km) and
+    needs a single ``cos`` per pair.  Use :func:`haversine_distance` for
+    inter-city legs.
+
+    Args:
+        loc1: First location.
+        loc2: Second location.
+
+    Returns:
+        Distance in meters.
+    """
+    R = EARTH_RADIUS_M
+    x = _wrap_lng_delta(math.radians(loc2.lng - loc1.lng)) * math.cos(
+        math.radians((loc1.lat + loc2.lat) / 2)
     )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
+    y = math.radians(loc2.lat - loc1.lat)
+    return R * math.hypot(x, y)
+
+
+def haversine_matrix(locations: list[Location]) -> list[list[float]]:
+    """
+    Build a symmetric great-circle distance matrix for a list of locations.
+
+    Radians and latitude cosines are computed once per point instead of
+    once per pair, so only the per-pair ``sin``/``asin`` terms remain in
+    the O(n^2) loop.
+
+    Args:
+        locations: Points to compute pairwise distances between.
+
+    Returns:
+        ``n x n`` matrix of distances in meters.
+    """
+    R = EARTH_RADIUS_M
+    n = len(locations)
+    lats = [math.radians(loc.lat) for loc in locations]
+    lngs = [math.radians(loc.lng) for loc in locations]
+    cos_lats = [math.cos(lat) for lat in lats]
+
+    matrix: list[list[float]] = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        lat_i, lng_i, cos_i = lats[i], lngs[i], cos_lats[i]
+        row_i = matrix[i]
+        for j in range(i + 1, n):
+            a = (
+                math.sin((lats[j] - lat_i) / 2) ** 2
+                + cos_i * cos_lats[j] * math.sin((lngs[j] - lng_i) / 2) ** 2
+            )
+            d = R * 2 * math.asin(math.sqrt(min(1.0, a)))
+            row_i[j] = d
+            matrix[j][i] = d
+    return matrix
+
+
+def equirectangular_matrix(locations: list[Location]) -> list[list[float]]:
+    """
+    Build a symmetric :func:`fast_distance` matrix for a list of locations.
+
+    Cheaper than :func:`haversine_matrix` and accurate enough within a
+    single city; use the haversine matrix for inter-city distances.
+
+    Args:
+        locations: Points to compute pairwise distances between.
+
+    Returns:
+        ``n x n`` matrix of distances in meters.
+    """
+    R = EARTH_RADIUS_M
+    n = len(locations)
+    lats = [math.radians(loc.lat) for loc in locations]
+    lngs = [math.radians(loc.lng) for loc in locations]
+
+    matrix: list[list[float]] = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        lat_i, lng_i = lats[i], lngs[i]
+        row_i = matrix[i]
+        for j in range(i + 1, n):
+            x = _wrap_lng_delta(lngs[j] - lng_i) * math.cos((lat_i + lats[j]) / 2)
+            d = R * math.hypot(x, lats[j] - lat_i)
+            row_i[j] = d
+            matrix[j][i] = d
+    return matrix
 
 
 # Type alias for the distance callback.
@@ -177,6 +287,11 @@ class RouteOptimizer:
         dist: DistanceFn,
     ) -> list[list[float]]:
         """Build a symmetric distance matrix between all places."""
+        if dist is haversine_distance:
+            return haversine_matrix([p.location for p in places])
+        if dist is fast_distance:
+            return equirectangular_matrix([p.location for p in places])
+
         n = len(places)
         matrix: list[list[float]] = [[0.0] * n for _ in range(n)]
         for i in range(n):
@@ -252,7 +367,7 @@ class RouteOptimizer:
                         tour[i + 1 : j + 1] = reversed(tour[i + 1 : j + 1])
                         improved = True
 
-        logger.debug(f"2-opt completed in {iterations} iterations")
+        logger.debug("2-opt completed in %d iterations", iterations)
         return tour
 
     def _two_opt_gain(
@@ -44,7 +44,7 @@ class CityAllocator:
         # Validate total days
         allocated = sum(c.get("day_count", 0) for c in result.cities)
         if allocated != total_days:
-            logger.warning(f"Allocated {allocated} days but requested {total_days}, adjusting last city")
+            logger.warning("Allocated %s days but requested %s, adjusting last city", allocated, total_days)
             if result.cities:
                 diff = total_days - allocated
                 result.cities[-1]["day_count"] = max(2, result.cities[-1].get("day_count", 2) + diff)
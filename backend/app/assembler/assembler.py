@@ -5,7 +5,7 @@ import logging
 from datetime import date, timedelta
 from uuid import UUID
 from app.assembler.allocator import CityAllocator
-from app.assembler.lookup import VariantLookup, LookupResult
+from app.assembler.lookup import VariantLookup, LookupResult, normalize_city_name
 from app.assembler.connector import CityConnector
 from app.services.google.weather import GoogleWeatherService
 from app.models.common import Location
@@ -64,8 +64,11 @@ class JourneyAssembler:
         needs_gen = [lr for lr in lookup_results if lr.needs_generation]
         job_ids = []
         if needs_gen:
+            allocs_by_city: dict[str, dict] = {}
+            for c in city_allocations:
+                allocs_by_city.setdefault(normalize_city_name(c.get("name", "")), c)
             for lr in needs_gen:
-                alloc = next((c for c in city_allocations if c.get("name", "").lower() == lr.city_name.lower()), {})
+                alloc = allocs_by_city.get(normalize_city_name(lr.city_name), {})
                 job = await self.job_repo.create(
                     job_type="on_demand",
                     city_id=lr.city_id,
@@ -45,7 +45,7 @@ class CityConnector:
         legs = []
         for i, result in enumerate(results):
             if isinstance(result, Exception):
-                logger.warning(f"Transport lookup failed: {result}")
+                logger.warning("Transport lookup failed: %s", result)
                 legs.append({
                     "from_city": city_sequence[i].get("city_name", ""),
                     "to_city": city_sequence[i + 1].get("city_name", ""),
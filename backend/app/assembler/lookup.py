@@ -1,6 +1,7 @@
 """Variant lookup — finds pre-generated plans for cities."""
 
 import logging
+from functools import lru_cache
 from uuid import UUID
 from dataclasses import dataclass
 from app.db.repository import CityRepository, VariantRepository
@@ -8,6 +9,24 @@ from app.db.repository import CityRepository, VariantRepository
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def normalize_city_name(name: str) -> str:
+    """Canonical form of a city name for matching.
+
+    ``"Paris"``, ``" paris "`` and ``"Paris, France"`` all map to ``"paris"``.
+    """
+    return name.split(",")[0].strip().casefold()
+
+
+def _country_matches(city, country: str) -> bool:
+    """True if *country* is the stored city's country name or code."""
+    wanted = country.strip().casefold()
+    return wanted in (
+        (city.country or "").strip().casefold(),
+        (city.country_code or "").strip().casefold(),
+    )
+
+
 @dataclass
 class LookupResult:
     city_id: UUID | None
@@ -35,12 +54,14 @@ class VariantLookup:
 
         Tries exact match first. Falls back to closest day_count.
         """
-        # Find city by name
+        # Find city by name within the requested country; same-name cities
+        # in other countries ("Paris, Texas") must not match
         city = None
         if country:
+            key = normalize_city_name(city_name)
             cities, _ = await self.city_repo.list(limit=100)
             for c in cities:
-                if c.name.lower() == city_name.lower():
+                if normalize_city_name(c.name) == key and _country_matches(c, country):
                     city = c
                     break
 
@@ -47,8 +47,22 @@ def should_use_search_grounding(agent_tier: str = "full") -> bool:
 # ---------------------------------------------------------------------------
 HTTP_DEFAULT_TIMEOUT: float = 30.0
 HTTP_MAX_RETRIES: int = 3
+# Pool sizing for the shared httpx client. Discovery and routing fan out
+# dozens of concurrent Google calls; keeping enough idle connections alive
+# lets the next fan-out reuse them instead of re-handshaking TLS.
+HTTP_MAX_CONNECTIONS: int = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 32
+HTTP_KEEPALIVE_EXPIRY: float = 30.0
 GOOGLE_API_TIMEOUT: float = 15.0
 WEATHER_API_TIMEOUT: float = 10.0
+# Per-attempt cap on a single LLM API call. SDK-level retries are disabled
+# and transient errors are retried by the services themselves, so one logical
+# call is bounded by a failed search-grounded attempt plus the fallback's
+# 1 + LLM_API_MAX_RETRIES attempts (4 x 180s = 12 min). A job makes many such
+# calls in sequence, so this does not bound a job; the worker keeps the job's
+# lock fresh with a heartbeat (JOB_HEARTBEAT_INTERVAL_SECONDS) instead.
+LLM_REQUEST_TIMEOUT: float = 180.0
+LLM_API_MAX_RETRIES: int = 2
 
 # ---------------------------------------------------------------------------
 # LLM defaults
@@ -329,16 +343,11 @@ def compute_haversine_fallback(
     Returns (distance_meters, duration_seconds). Falls back to fixed
     defaults when coordinates are zero/missing.
     """
-    import math
+    from app.algorithms.tsp import haversine_meters
     if not (origin_lat and origin_lng and dest_lat and dest_lng):
         return FALLBACK_DISTANCE_METERS, FALLBACK_DURATION_SECONDS
 
-    R = 6_371_000  # Earth radius in meters
-    lat1, lat2 = math.radians(origin_lat), math.radians(dest_lat)
-    dlat = math.radians(dest_lat - origin_lat)
-    dlng = math.radians(dest_lng - origin_lng)
-    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng / 2) ** 2
-    distance_m = int(R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)))
+    distance_m = int(haversine_meters(origin_lat, origin_lng, dest_lat, dest_lng))
     # Assume 4 km/h walking speed
     duration_s = int(distance_m / (4000 / 3600))
     return distance_m, duration_s
@@ -432,6 +441,9 @@ DRAFT_DISCOVERY_CANDIDATES: int = 60
 # Job queue
 JOB_STALE_TIMEOUT_MINUTES: int = 15
 JOB_POLL_INTERVAL_SECONDS: int = 5
+# How often a running job refreshes locked_at; must stay well under
+# JOB_STALE_TIMEOUT_MINUTES so healthy long jobs are never recovered as stale.
+JOB_HEARTBEAT_INTERVAL_SECONDS: int = 60
 WORKER_CONCURRENCY: int = 1  # jobs processed at a time
 
 # Smart refresh
@@ -9,20 +9,38 @@ _client: httpx.AsyncClient | None = None
 DEFAULT_TIMEOUT = 30.0
 MAX_RETRIES = 3
 RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32)
 
 
 def _load_defaults():
-    """Load timeout/retry config from planning module."""
-    global DEFAULT_TIMEOUT, MAX_RETRIES
-    from app.config.planning import HTTP_DEFAULT_TIMEOUT, HTTP_MAX_RETRIES
+    """Load timeout/retry/pool config from planning module."""
+    global DEFAULT_TIMEOUT, MAX_RETRIES, DEFAULT_LIMITS
+    from app.config.planning import (
+        HTTP_DEFAULT_TIMEOUT,
+        HTTP_KEEPALIVE_EXPIRY,
+        HTTP_MAX_CONNECTIONS,
+        HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        HTTP_MAX_RETRIES,
+    )
     DEFAULT_TIMEOUT = HTTP_DEFAULT_TIMEOUT
     MAX_RETRIES = HTTP_MAX_RETRIES
+    DEFAULT_LIMITS = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    )
 
 
 async def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first use.
+
+    All services share this one connection pool, so keep-alive connections
+    to Google APIs are reused across requests and worker jobs.
+    """
     global _client
     if _client is None or _client.is_closed:
-        transport = httpx.AsyncHTTPTransport(retries=2)
+        _load_defaults()
+        transport = httpx.AsyncHTTPTransport(retries=2, limits=DEFAULT_LIMITS)
         _client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, transport=transport)
     return _client
 
@@ -136,6 +136,13 @@ class PlaceRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_google_ids_by_city(self, city_id: UUID) -> set[str]:
+        """Return just the google_place_ids for a city, without loading rows."""
+        result = await self.session.execute(
+            select(Place.google_place_id).where(Place.city_id == city_id)
+        )
+        return set(result.scalars().all())
+
     async def get(self, place_id: UUID) -> Place | None:
         return await self.session.get(Place, place_id)
 
@@ -423,6 +430,23 @@ class JobRepository:
     async def get(self, job_id: UUID) -> GenerationJob | None:
         return await self.session.get(GenerationJob, job_id)
 
+    async def heartbeat(self, job_id: UUID, worker_id: str) -> bool:
+        """Refresh ``locked_at`` for a job this worker is still running.
+
+        Returns False if the job is no longer running under *worker_id*.
+        """
+        result = await self.session.execute(
+            update(GenerationJob)
+            .where(
+                GenerationJob.id == job_id,
+                GenerationJob.status == "running",
+                GenerationJob.locked_by == worker_id,
+            )
+            .values(locked_at=datetime.now(timezone.utc))
+        )
+        await self.session.commit()
+        return result.rowcount > 0
+
     async def recover_stale(self, timeout_minutes: int = 15) -> int:
         """Reset running jobs that have been locked longer than timeout."""
         cutoff = datetime.now(timezone.utc) - timedelta(minutes=timeout_minutes)
@@ -1,5 +1,8 @@
 """FastAPI dependency injection wiring for content library platform."""
 
+from functools import lru_cache
+
+import httpx
 from fastapi import Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -86,11 +89,21 @@ def get_llm_service() -> LLMService:
     return create_llm_service(settings)
 
 
+@lru_cache(maxsize=4)
+def _shared_places_service(
+    api_key: str, http: httpx.AsyncClient
+) -> GooglePlacesService:
+    return GooglePlacesService(api_key, http)
+
+
 def get_places_service(
     settings: Settings = Depends(get_settings),
     http=Depends(_get_http),
 ) -> GooglePlacesService:
-    return GooglePlacesService(settings.google_places_api_key, http)
+    """Reuse one places service per shared client so its geocode cache
+    survives across requests (keyed on the client, so a recreated client
+    gets a fresh service)."""
+    return _shared_places_service(settings.google_places_api_key, http)
 
 
 def get_routes_service(
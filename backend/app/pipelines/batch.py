@@ -1,5 +1,6 @@
 """Batch pipeline — full quality generation for content library."""
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -207,6 +208,8 @@ class BatchPipeline:
     ) -> dict[str, UUID]:
         """Upsert candidates into the places table. Returns google_place_id -> db UUID map."""
         place_id_map: dict[str, UUID] = {}
+        # One discovery run verified all of these; stamp them consistently.
+        verified_at = datetime.now(timezone.utc)
         for candidate in candidates:
             gpid = candidate.get("google_place_id") or candidate.get("place_id")
             if not gpid:
@@ -227,7 +230,7 @@ class BatchPipeline:
                 editorial_summary=candidate.get("editorial_summary"),
                 website_url=candidate.get("website_url"),
                 is_lodging=candidate.get("is_lodging", False),
-                last_verified_at=datetime.now(timezone.utc),
+                last_verified_at=verified_at,
             )
             place_id_map[gpid] = place.id
         return place_id_map
@@ -240,22 +243,22 @@ class BatchPipeline:
         country: str,
         pace: str,
     ) -> list[tuple[Any, Any, list]]:
-        """Route and schedule each curated day. Returns list of (day, routing_result, scheduled)."""
-        scheduled_days = []
-        all_candidates = discovery_result.candidates + discovery_result.lodging_candidates
+        """Route and schedule each curated day. Returns list of (day, routing_result, scheduled).
 
+        Days are routed concurrently; each day is scheduled as soon as its
+        routing completes, while other days' Routes calls are still in flight.
+        """
+        # Index candidates by place id once; first occurrence wins, as before.
+        candidates_by_id: dict[str, dict] = {}
+        for c in discovery_result.candidates + discovery_result.lodging_candidates:
+            candidates_by_id.setdefault(c.get("google_place_id") or c.get("place_id"), c)
+
+        day_activities: list[tuple[Any, list[dict]]] = []
         for day in curation_result.days:
             activities = []
             for act in day.activities:
                 gpid = act.google_place_id
-                candidate = next(
-                    (
-                        c
-                        for c in all_candidates
-                        if (c.get("google_place_id") or c.get("place_id")) == gpid
-                    ),
-                    {},
-                )
+                candidate = candidates_by_id.get(gpid, {})
                 activities.append(
                     {
                         "google_place_id": gpid,
@@ -272,23 +275,38 @@ class BatchPipeline:
                     }
                 )
 
-            routing_result = await self.routing.route_day(activities, pace=pace)
+            day_activities.append((day, activities))
 
-            routes_as_dicts = [
-                {
-                    "duration_seconds": r.duration_seconds,
-                    "distance_meters": r.distance_meters,
-                    "travel_mode": r.travel_mode,
-                }
-                for r in routing_result.routes
-            ]
-            scheduled = self.scheduling.schedule_day(
-                activities=routing_result.ordered_activities,
-                routes=routes_as_dicts,
-                country=country,
-                pace=pace,
-            )
-            scheduled_days.append((day, routing_result, scheduled))
+        async def _route(index: int, activities: list[dict]) -> tuple[int, Any]:
+            return index, await self.routing.route_day(activities, pace=pace)
+
+        tasks = [
+            asyncio.ensure_future(_route(i, activities))
+            for i, (_, activities) in enumerate(day_activities)
+        ]
+        scheduled_days: list[Any] = [None] * len(tasks)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, routing_result = await next_done
+                routes_as_dicts = [
+                    {
+                        "duration_seconds": r.duration_seconds,
+                        "distance_meters": r.distance_meters,
+                        "travel_mode": r.travel_mode,
+                    }
+                    for r in routing_result.routes
+                ]
+                scheduled = self.scheduling.schedule_day(
+                    activities=routing_result.ordered_activities,
+                    routes=routes_as_dicts,
+                    country=country,
+                    pace=pace,
+                )
+                scheduled_days[index] = (day_activities[index][0], routing_result, scheduled)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
         return scheduled_days
 
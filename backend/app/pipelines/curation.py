@@ -12,7 +12,7 @@ from pydantic import BaseModel
 
 from app.algorithms.scheduler import ScheduleConfig
 from app.prompts.loader import PromptLoader
-from app.services.llm.base import LLMService
+from app.services.llm.base import LLMService, extract_json
 
 logger = logging.getLogger(__name__)
 
@@ -219,14 +219,8 @@ class CurationPipeline:
 
     def _parse_raw_output(self, raw: str) -> CurationOutput:
         """Try to parse raw LLM text into CurationOutput, handling common wrapper keys."""
-        # Extract JSON from markdown code blocks if present
-        text = raw.strip()
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0].strip()
-
-        data = json.loads(text)
+        # Tolerates markdown code fences and surrounding prose
+        data = extract_json(raw)
 
         # Normalize: extract days from various LLM output shapes
         if "days" not in data or not isinstance(data.get("days"), list):
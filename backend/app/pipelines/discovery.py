@@ -115,7 +115,7 @@ class DiscoveryPipeline:
                 seen_ids.add(candidate.place_id)
 
                 # Separate lodging from activities
-                if any(t in LODGING_TYPES for t in (candidate.types or [])):
+                if not LODGING_TYPES.isdisjoint(candidate.types or ()):
                     lodging_candidates.append(candidate)
                 else:
                     all_candidates.append(candidate)
@@ -156,20 +156,23 @@ class DiscoveryPipeline:
         )
 
     async def _discover_lodging(self, city_name: str, location: Any) -> list[PlaceCandidate]:
-        """Search for lodging options."""
-        results: list[PlaceCandidate] = []
+        """Search for lodging options (queries run concurrently)."""
         queries = [
             f"hotels in {city_name}",
             f"boutique hotels {city_name}",
             f"hostels {city_name}",
         ]
-        for query in queries:
-            try:
-                hotel = await self.places.search_lodging(query, location)
-                if hotel:
-                    results.append(hotel)
-            except Exception as e:
-                logger.warning("Lodging search failed for '%s': %s", query, e)
+        hotels = await asyncio.gather(
+            *(self.places.search_lodging(query, location) for query in queries),
+            return_exceptions=True,
+        )
+
+        results: list[PlaceCandidate] = []
+        for query, hotel in zip(queries, hotels):
+            if isinstance(hotel, Exception):
+                logger.warning("Lodging search failed for '%s': %s", query, hotel)
+            elif hotel:
+                results.append(hotel)
         return results
 
     def _candidate_to_dict(self, candidate: PlaceCandidate) -> dict[str, Any]:
@@ -192,7 +195,7 @@ class DiscoveryPipeline:
             "photo_references": candidate.photo_references or [],
             "editorial_summary": candidate.editorial_summary,
             "website_url": candidate.website,
-            "is_lodging": any(t in LODGING_TYPES for t in (candidate.types or [])),
+            "is_lodging": not LODGING_TYPES.isdisjoint(candidate.types or ()),
             "business_status": candidate.business_status or "OPERATIONAL",
         }
 
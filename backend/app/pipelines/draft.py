@@ -1,5 +1,6 @@
 """Draft pipeline — fast single-pass generation for cache misses."""
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -225,6 +226,8 @@ class DraftPipeline:
     ) -> dict[str, UUID]:
         """Upsert candidates into places table. Returns google_place_id -> db UUID map."""
         place_id_map: dict[str, UUID] = {}
+        # One discovery run verified all of these; stamp them consistently.
+        verified_at = datetime.now(timezone.utc)
         for candidate in candidates:
             gpid = candidate.get("google_place_id") or candidate.get("place_id")
             if not gpid:
@@ -245,7 +248,7 @@ class DraftPipeline:
                 editorial_summary=candidate.get("editorial_summary"),
                 website_url=candidate.get("website_url"),
                 is_lodging=candidate.get("is_lodging", False),
-                last_verified_at=datetime.now(timezone.utc),
+                last_verified_at=verified_at,
             )
             place_id_map[gpid] = place.id
         return place_id_map
@@ -258,22 +261,21 @@ class DraftPipeline:
         country: str,
         pace: str,
     ) -> list[tuple[Any, Any, list]]:
-        """Route and schedule each curated day."""
-        scheduled_days = []
-        all_candidates = discovery_result.candidates + discovery_result.lodging_candidates
+        """Route and schedule each curated day.
 
+        Days are routed concurrently and scheduled as their routing completes.
+        """
+        # Index candidates by place id once; first occurrence wins, as before.
+        candidates_by_id: dict[str, dict] = {}
+        for c in discovery_result.candidates + discovery_result.lodging_candidates:
+            candidates_by_id.setdefault(c.get("google_place_id") or c.get("place_id"), c)
+
+        day_activities: list[tuple[Any, list[dict]]] = []
         for day in curation_result.days:
             activities = []
             for act in day.activities:
                 gpid = act.google_place_id
-                candidate = next(
-                    (
-                        c
-                        for c in all_candidates
-                        if (c.get("google_place_id") or c.get("place_id")) == gpid
-                    ),
-                    {},
-                )
+                candidate = candidates_by_id.get(gpid, {})
                 activities.append(
                     {
                         "google_place_id": gpid,
@@ -290,22 +292,37 @@ class DraftPipeline:
                     }
                 )
 
-            routing_result = await self.routing.route_day(activities, pace=pace)
+            day_activities.append((day, activities))
 
-            routes_as_dicts = [
-                {
-                    "duration_seconds": r.duration_seconds,
-                    "distance_meters": r.distance_meters,
-                    "travel_mode": r.travel_mode,
-                }
-                for r in routing_result.routes
-            ]
-            scheduled = self.scheduling.schedule_day(
-                activities=routing_result.ordered_activities,
-                routes=routes_as_dicts,
-                country=country,
-                pace=pace,
-            )
-            scheduled_days.append((day, routing_result, scheduled))
+        async def _route(index: int, activities: list[dict]) -> tuple[int, Any]:
+            return index, await self.routing.route_day(activities, pace=pace)
+
+        tasks = [
+            asyncio.ensure_future(_route(i, activities))
+            for i, (_, activities) in enumerate(day_activities)
+        ]
+        scheduled_days: list[Any] = [None] * len(tasks)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, routing_result = await next_done
+                routes_as_dicts = [
+                    {
+                        "duration_seconds": r.duration_seconds,
+                        "distance_meters": r.distance_meters,
+                        "travel_mode": r.travel_mode,
+                    }
+                    for r in routing_result.routes
+                ]
+                scheduled = self.scheduling.schedule_day(
+                    activities=routing_result.ordered_activities,
+                    routes=routes_as_dicts,
+                    country=country,
+                    pace=pace,
+                )
+                scheduled_days[index] = (day_activities[index][0], routing_result, scheduled)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
         return scheduled_days
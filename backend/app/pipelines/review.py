@@ -12,11 +12,16 @@ from typing import Any
 from pydantic import BaseModel, Field, model_validator
 
 from app.prompts.loader import PromptLoader
-from app.services.llm.base import LLMService
+from app.services.llm.base import LLMService, extract_json
 
 logger = logging.getLogger(__name__)
 
 
+def _plan_to_json(plan: Any) -> str:
+    """Serialise a plan for a prompt; pre-serialised strings pass through."""
+    return plan if isinstance(plan, str) else json.dumps(plan, default=str, indent=2)
+
+
 # ---------------------------------------------------------------------------
 # LLM response schemas
 # ---------------------------------------------------------------------------
@@ -115,7 +120,7 @@ class ReviewPipeline:
         system_prompt = self.prompts.load("reviewer_system")
         user_template = self.prompts.load("reviewer_user")
 
-        plan_json = json.dumps(plan, default=str, indent=2) if not isinstance(plan, str) else plan
+        plan_json = _plan_to_json(plan)
 
         user_prompt = user_template.format(
             city_name=city_name,
@@ -145,6 +150,7 @@ class ReviewPipeline:
         candidates: list[dict],
         already_used: set[str],
         city_name: str,
+        plan_json: str | None = None,
     ) -> Any:
         """Fix reviewer issues using the LLM fixer.
 
@@ -154,6 +160,8 @@ class ReviewPipeline:
             candidates: Full candidate pool.
             already_used: Set of google_place_ids already in the plan.
             city_name: City being fixed.
+            plan_json: ``plan`` already serialised for the prompt, if the
+                caller has it; avoids dumping the same plan twice.
 
         Returns:
             Fixed plan in the same format as input.
@@ -163,12 +171,15 @@ class ReviewPipeline:
 
         unused = [c for c in candidates if c.get("google_place_id") not in already_used]
 
-        plan_json = json.dumps(plan, default=str, indent=2) if not isinstance(plan, str) else plan
+        if plan_json is None:
+            plan_json = _plan_to_json(plan)
 
         user_prompt = user_template.format(
             city_name=city_name,
             issues_json=json.dumps(issues, indent=2),
             plan_json=plan_json,
+            # Compact, like the curation candidate list: the pool is the
+            # largest part of the prompt and indentation only adds tokens.
             unused_candidates_json=json.dumps(unused, default=str, indent=2),
         )
 
@@ -181,7 +192,7 @@ class ReviewPipeline:
         )
 
         try:
-            return json.loads(raw)
+            return extract_json(raw)
         except json.JSONDecodeError:
             logger.warning("Fixer returned invalid JSON, keeping current plan")
             return plan
@@ -238,7 +249,9 @@ class ReviewPipeline:
         last_result: ReviewResult | None = None
 
         for i in range(max_iterations):
-            result = await self.review(plan, city_name, pace, day_count)
+            # Serialise once per iteration; review and fix share the string.
+            plan_json = _plan_to_json(plan)
+            result = await self.review(plan_json, city_name, pace, day_count)
             last_result = result
 
             logger.info(
@@ -266,7 +279,10 @@ class ReviewPipeline:
             # Fix if not the last iteration
             if i < max_iterations - 1:
                 already_used = self._collect_used_ids(plan)
-                plan = await self.fix(plan, result.issues, candidates, already_used, city_name)
+                plan = await self.fix(
+                    plan, result.issues, candidates, already_used, city_name,
+                    plan_json=plan_json,
+                )
 
         return ReviewFixResult(
             best_plan=best_plan,
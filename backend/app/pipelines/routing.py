@@ -2,11 +2,15 @@
 
 import asyncio
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Coroutine
 from dataclasses import dataclass
+from typing import Any
 
 from app.models.common import Location
 from app.services.google.routes import GoogleRoutesService
-from app.algorithms.tsp import RouteOptimizer, haversine_distance
+from app.algorithms.tsp import RouteOptimizer, equirectangular_matrix, fast_distance
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +21,23 @@ WALK_THRESHOLDS = {
     "packed": 15 * 60,     # 15 min
 }
 
+# Hops shorter than this (straight-line) are always walked, so the Routes
+# API is skipped and the walk is estimated locally.
+SHORT_HOP_METERS = 400
+WALK_DETOUR_FACTOR = 1.3   # street distance vs straight line
+WALK_SPEED_MPS = 4000 / 3600  # 4 km/h, matches compute_haversine_fallback
 
-@dataclass
+# Computed routes are memoized per pipeline instance (the worker keeps one
+# for its lifetime), so variants of the same city reuse Routes API results.
+ROUTE_CACHE_MAX_ENTRIES = 5000
+ROUTE_CACHE_TTL_SECONDS = 24 * 3600
+ROUTE_CACHE_PRECISION = 4  # decimal places, ~11 m
+
+# (travel_mode, distance_meters, duration_seconds, polyline)
+_CachedRoute = tuple[str, int, int, str | None]
+
+
+@dataclass(slots=True)
 class RouteResult:
     """Route between two activities."""
     from_sequence: int
@@ -42,6 +61,7 @@ class RoutingPipeline:
     def __init__(self, routes_service: GoogleRoutesService):
         self.routes = routes_service
         self.optimizer = RouteOptimizer()
+        self._route_cache: OrderedDict[tuple, tuple[float, _CachedRoute]] = OrderedDict()
 
     async def route_day(
         self,
@@ -79,8 +99,11 @@ class RoutingPipeline:
         if len(locations) < 2:
             return activities
 
-        # Nearest-neighbor greedy ordering
+        # Nearest-neighbor greedy ordering over a precomputed matrix.
+        # Activities are all within one city, so the equirectangular
+        # approximation is accurate enough for ordering.
         n = len(locations)
+        matrix = equirectangular_matrix(locations)
         visited = [False] * n
         order = [0]
         visited[0] = True
@@ -91,18 +114,20 @@ class RoutingPipeline:
             best_dist = float("inf")
             for j in range(n):
                 if not visited[j]:
-                    d = haversine_distance(locations[current], locations[j])
+                    d = matrix[current][j]
                     if d < best_dist:
                         best_dist = d
                         best_next = j
             order.append(best_next)
             visited[best_next] = True
 
-        # Reorder activities and update sequences
+        # Reorder activities and update sequences. Only activities whose
+        # sequence changes are copied; the rest are passed through as-is.
         reordered = []
         for idx, orig_idx in enumerate(order):
-            act = dict(activities[orig_idx])
-            act["sequence"] = idx + 1
+            act = activities[orig_idx]
+            if act.get("sequence") != idx + 1:
+                act = {**act, "sequence": idx + 1}
             reordered.append(act)
 
         return reordered
@@ -110,48 +135,131 @@ class RoutingPipeline:
     async def _compute_routes(
         self, activities: list[dict], walk_threshold: int
     ) -> list[RouteResult]:
-        """Compute routes between consecutive activities in parallel."""
-        tasks = []
+        """Compute routes between consecutive activities in parallel.
+
+        Short hops and cached legs are resolved inline; only the remaining
+        legs go through ``asyncio.gather``, and the gather is skipped when
+        every leg resolves locally.
+        """
+        routes: list[RouteResult | None] = []
+        pending: dict[int, Coroutine[Any, Any, RouteResult]] = {}
         for i in range(len(activities) - 1):
             loc_a = activities[i].get("location", {})
             loc_b = activities[i + 1].get("location", {})
             origin = Location(lat=loc_a.get("lat", 0), lng=loc_a.get("lng", 0))
             dest = Location(lat=loc_b.get("lat", 0), lng=loc_b.get("lng", 0))
-            tasks.append(self._compute_one_route(origin, dest, i, walk_threshold))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        routes = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.warning("Route computation failed for leg %d: %s", i, result)
-                routes.append(RouteResult(
-                    from_sequence=i + 1,
-                    to_sequence=i + 2,
-                    travel_mode="walk",
-                    distance_meters=800,
-                    duration_seconds=720,
-                ))
-            else:
-                routes.append(result)
+            local = self._local_route(origin, dest, i, walk_threshold)
+            routes.append(local)
+            if local is None:
+                pending[i] = self._fetch_route(origin, dest, i, walk_threshold)
+
+        if pending:
+            results = await asyncio.gather(*pending.values(), return_exceptions=True)
+            for i, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    logger.warning("Route computation failed for leg %d: %s", i, result)
+                    result = RouteResult(
+                        from_sequence=i + 1,
+                        to_sequence=i + 2,
+                        travel_mode="walk",
+                        distance_meters=800,
+                        duration_seconds=720,
+                    )
+                routes[i] = result
 
         return routes
 
-    async def _compute_one_route(
+    def _local_route(
+        self, origin: Location, dest: Location, index: int, walk_threshold: int
+    ) -> RouteResult | None:
+        """Resolve a leg without the Routes API, or return None.
+
+        Short hops become a straight-line walk estimate; previously computed
+        pairs come from the route cache. Legs with a zero/missing coordinate
+        are left to the Routes service and its fixed fallback, matching
+        ``compute_haversine_fallback``.
+        """
+        if not (origin.lat and origin.lng and dest.lat and dest.lng):
+            return None
+
+        straight_line = fast_distance(origin, dest)
+        if straight_line < SHORT_HOP_METERS:
+            distance = int(straight_line * WALK_DETOUR_FACTOR)
+            return RouteResult(
+                from_sequence=index + 1,
+                to_sequence=index + 2,
+                travel_mode="walk",
+                distance_meters=distance,
+                duration_seconds=int(distance / WALK_SPEED_MPS),
+            )
+
+        cached = self._get_cached_route(
+            self._route_cache_key(origin, dest, walk_threshold)
+        )
+        if cached is None:
+            return None
+        return self._to_route_result(index, cached)
+
+    async def _fetch_route(
         self, origin: Location, dest: Location, index: int, walk_threshold: int
     ) -> RouteResult:
-        """Compute a single route, choosing walk vs drive based on threshold."""
+        """Compute a single route via the Routes API, choosing walk vs drive."""
         route = await self.routes.compute_best_route(
             origin, dest, walk_threshold_seconds=walk_threshold
         )
         travel_mode = route.travel_mode
         if hasattr(travel_mode, "value"):
             travel_mode = travel_mode.value
+        cached = (
+            str(travel_mode).lower(),
+            route.distance_meters,
+            route.duration_seconds,
+            getattr(route, "polyline", None),
+        )
+        # Heuristic fallbacks carry no polyline; only cache real routes.
+        if cached[3]:
+            self._store_cached_route(
+                self._route_cache_key(origin, dest, walk_threshold), cached
+            )
+        return self._to_route_result(index, cached)
+
+    @staticmethod
+    def _to_route_result(index: int, cached: _CachedRoute) -> RouteResult:
+        travel_mode, distance, duration, polyline = cached
         return RouteResult(
             from_sequence=index + 1,
             to_sequence=index + 2,
-            travel_mode=str(travel_mode).lower(),
-            distance_meters=route.distance_meters,
-            duration_seconds=route.duration_seconds,
-            polyline=getattr(route, "polyline", None),
+            travel_mode=travel_mode,
+            distance_meters=distance,
+            duration_seconds=duration,
+            polyline=polyline,
+        )
+
+    @staticmethod
+    def _route_cache_key(
+        origin: Location, dest: Location, walk_threshold: int
+    ) -> tuple:
+        return (
+            round(origin.lat, ROUTE_CACHE_PRECISION),
+            round(origin.lng, ROUTE_CACHE_PRECISION),
+            round(dest.lat, ROUTE_CACHE_PRECISION),
+            round(dest.lng, ROUTE_CACHE_PRECISION),
+            walk_threshold,
         )
+
+    def _get_cached_route(self, key: tuple) -> _CachedRoute | None:
+        entry = self._route_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, route = entry
+        if time.monotonic() - stored_at > ROUTE_CACHE_TTL_SECONDS:
+            del self._route_cache[key]
+            return None
+        self._route_cache.move_to_end(key)
+        return route
+
+    def _store_cached_route(self, key: tuple, route: _CachedRoute) -> None:
+        self._route_cache[key] = (time.monotonic(), route)
+        self._route_cache.move_to_end(key)
+        while len(self._route_cache) > ROUTE_CACHE_MAX_ENTRIES:
+            self._route_cache.popitem(last=False)
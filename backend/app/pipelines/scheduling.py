@@ -95,7 +95,7 @@ class SchedulingPipeline:
                 close_minutes = self._get_close_time(opening_hours)
                 if close_minutes and current_time + duration > close_minutes:
                     if current_time >= close_minutes:
-                        logger.warning(f"Skipping activity {activity.get('name', '?')} — already past closing")
+                        logger.warning("Skipping activity %s — already past closing", activity.get("name", "?"))
                         continue
                     # Truncate
                     duration = max(15, close_minutes - current_time)
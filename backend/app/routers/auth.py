@@ -131,6 +131,7 @@ async def callback(provider: str, request: Request, response: Response):
     # Fetch user info
     try:
         resp = await client.get(config["userinfo_url"])
+        resp.raise_for_status()
         userinfo = resp.json()
     except Exception as exc:
         logger.error("Failed to fetch user info: %s", exc)
@@ -149,6 +150,7 @@ async def callback(provider: str, request: Request, response: Response):
         if not email:
             try:
                 email_resp = await client.get("https://api.github.com/user/emails")
+                email_resp.raise_for_status()
                 emails = email_resp.json()
                 primary = next((e for e in emails if e.get("primary")), None)
                 email = primary["email"] if primary else ""
@@ -13,6 +13,8 @@ _PHOTO_REF_PATTERN = re.compile(
     r"^places%2F[A-Za-z0-9_-]+%2Fphotos%2F[A-Za-z0-9_-]+$"
 )
 
+_HOTEL_TYPES = frozenset({"lodging", "hotel", "resort_hotel"})
+
 
 @router.get("/search")
 async def search_places(
@@ -65,7 +67,7 @@ async def get_alternatives(
         if c.place_id == place_id:
             continue
         # Only include lodging-type results
-        if not any(t in c.types for t in ("lodging", "hotel", "resort_hotel")):
+        if _HOTEL_TYPES.isdisjoint(c.types):
             continue
         alternatives.append({
             "name": c.name,
@@ -26,7 +26,7 @@ from app.config.planning import GOOGLE_API_TIMEOUT as REQUEST_TIMEOUT
 # ── Internal data classes (not API-facing) ──────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class TransitLine:
     """A single transit line (bus, metro, train, ferry, etc.)."""
 
@@ -38,7 +38,7 @@ class TransitLine:
     url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TransitStop:
     """A transit stop / station."""
 
@@ -46,7 +46,7 @@ class TransitStop:
     location: dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TransitStep:
     """One step of a transit journey (a single vehicle leg)."""
 
@@ -62,7 +62,7 @@ class TransitStep:
     travel_mode: str = "TRANSIT"
 
 
-@dataclass
+@dataclass(slots=True)
 class TransitRoute:
     """A complete transit route (may contain multiple steps / transfers)."""
 
@@ -77,7 +77,7 @@ class TransitRoute:
     summary: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DrivingRoute:
     """A driving route summary."""
 
@@ -89,7 +89,7 @@ class DrivingRoute:
     summary: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TransportOptions:
     """Aggregated transport options between two points."""
 
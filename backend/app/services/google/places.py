@@ -33,6 +33,54 @@ DEFAULT_ESSENTIAL_TYPES: list[str] = [
 
 DINING_TYPES: list[str] = ["restaurant", "cafe", "bakery"]
 
+# Destination landscape buckets, in display order, and the place types that
+# map into them. The first matching type on a landmark wins.
+_LANDSCAPE_OTHER = "Other attractions"
+_LANDSCAPE_CATEGORIES: tuple[str, ...] = (
+    "Theme parks & entertainment",
+    "Nature & wildlife",
+    "Cultural & historical",
+    "Religious & spiritual",
+    "Shopping & markets",
+    "Landmarks & viewpoints",
+    _LANDSCAPE_OTHER,
+)
+_LANDSCAPE_CATEGORY_BY_TYPE: dict[str, str] = {
+    "amusement_park": "Theme parks & entertainment",
+    "theme_park": "Theme parks & entertainment",
+    "water_park": "Theme parks & entertainment",
+    "zoo": "Nature & wildlife",
+    "aquarium": "Nature & wildlife",
+    "park": "Nature & wildlife",
+    "national_park": "Nature & wildlife",
+    "garden": "Nature & wildlife",
+    "mountain_peak": "Nature & wildlife",
+    "natural_feature": "Nature & wildlife",
+    "scenic_spot": "Nature & wildlife",
+    "hiking_area": "Nature & wildlife",
+    "wildlife_park": "Nature & wildlife",
+    "nature_preserve": "Nature & wildlife",
+    "museum": "Cultural & historical",
+    "art_gallery": "Cultural & historical",
+    "historical_landmark": "Cultural & historical",
+    "monument": "Cultural & historical",
+    "castle": "Cultural & historical",
+    "temple": "Religious & spiritual",
+    "church": "Religious & spiritual",
+    "mosque": "Religious & spiritual",
+    "hindu_temple": "Religious & spiritual",
+    "buddhist_temple": "Religious & spiritual",
+    "shinto_shrine": "Religious & spiritual",
+    "shopping_mall": "Shopping & markets",
+    "market": "Shopping & markets",
+    "tourist_attraction": "Landmarks & viewpoints",
+}
+_LANDSCAPE_FOOTER = (
+    "\n"
+    "Use this landscape to set experience_themes and allocate days.\n"
+    "Do NOT copy specific attraction names — describe experience categories instead."
+)
+
 
 def _get_essential_types(interests: list[str]) -> list[str]:
     """Return essential place types, filtering out those already covered by interests.
@@ -62,6 +110,9 @@ class GooglePlacesService:
     def __init__(self, api_key: str, client: httpx.AsyncClient) -> None:
         self.api_key = api_key
         self.client = client
+        # City coordinates don't change, so geocode results are kept for the
+        # lifetime of the service (the worker shares one across jobs).
+        self._geocode_cache: dict[str, dict[str, Any]] = {}
 
     # ── Public methods ──────────────────────────────────────────────────
 
@@ -69,15 +120,24 @@ class GooglePlacesService:
         """Geocode a place name and return basic info.
 
         Returns a dict with keys: ``name``, ``place_id``, ``lat``, ``lng``,
-        ``country``, ``timezone``.
+        ``country``, ``timezone``. Results are cached per normalized query.
         """
+        key = " ".join(query.split()).casefold()
+        cached = self._geocode_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        result = await self._geocode_uncached(query)
+        self._geocode_cache[key] = result
+        return dict(result)
+
+    async def _geocode_uncached(self, query: str) -> dict[str, Any]:
         url = f"{BASE_URL}/places:searchText"
         headers = {
             "X-Goog-Api-Key": self.api_key,
             "X-Goog-FieldMask": (
                 "places.displayName,places.id,places.location,"
-                "places.addressComponents,places.utcOffsetMinutes,"
-                "places.formattedAddress"
+                "places.addressComponents,places.utcOffsetMinutes"
             ),
         }
         body = {"textQuery": query, "maxResultCount": 1}
@@ -186,14 +246,23 @@ class GooglePlacesService:
             type_batches: list[list[str]] = [[t] for t in essential_types]
             type_batches.extend([[t] for t in interest_types])
             type_batches.append(DINING_TYPES)
-            for types_batch in type_batches:
-                expanded = await self._nearby_search(
-                    location=location,
-                    included_types=types_batch,
-                    radius_meters=15000,
-                    max_results=10,
-                )
-                existing_ids = {p.place_id for p in all_places}
+            expanded_results = await asyncio.gather(
+                *(
+                    self._nearby_search(
+                        location=location,
+                        included_types=types_batch,
+                        radius_meters=15000,
+                        max_results=10,
+                    )
+                    for types_batch in type_batches
+                ),
+                return_exceptions=True,
+            )
+            existing_ids = {p.place_id for p in all_places}
+            for expanded in expanded_results:
+                if isinstance(expanded, Exception):
+                    logger.warning("Expanded nearby search failed: %s", expanded)
+                    continue
                 for p in expanded:
                     if p.place_id not in existing_ids:
                         all_places.append(p)
@@ -413,55 +482,18 @@ class GooglePlacesService:
             return ""
 
         categories: dict[str, list[dict[str, Any]]] = {
-            "Theme parks & entertainment": [],
-            "Nature & wildlife": [],
-            "Cultural & historical": [],
-            "Religious & spiritual": [],
-            "Shopping & markets": [],
-            "Landmarks & viewpoints": [],
-            "Other attractions": [],
+            name: [] for name in _LANDSCAPE_CATEGORIES
         }
-
-        type_map = {
-            "amusement_park": "Theme parks & entertainment",
-            "theme_park": "Theme parks & entertainment",
-            "water_park": "Theme parks & entertainment",
-            "zoo": "Nature & wildlife",
-            "aquarium": "Nature & wildlife",
-            "park": "Nature & wildlife",
-            "national_park": "Nature & wildlife",
-            "garden": "Nature & wildlife",
-            "mountain_peak": "Nature & wildlife",
-            "natural_feature": "Nature & wildlife",
-            "scenic_spot": "Nature & wildlife",
-            "hiking_area": "Nature & wildlife",
-            "wildlife_park": "Nature & wildlife",
-            "nature_preserve": "Nature & wildlife",
-            "museum": "Cultural & historical",
-            "art_gallery": "Cultural & historical",
-            "historical_landmark": "Cultural & historical",
-            "monument": "Cultural & historical",
-            "castle": "Cultural & historical",
-            "temple": "Religious & spiritual",
-            "church": "Religious & spiritual",
-            "mosque": "Religious & spiritual",
-            "hindu_temple": "Religious & spiritual",
-            "buddhist_temple": "Religious & spiritual",
-            "shinto_shrine": "Religious & spiritual",
-            "shopping_mall": "Shopping & markets",
-            "market": "Shopping & markets",
-            "tourist_attraction": "Landmarks & viewpoints",
-        }
-
         for lm in landmarks:
-            placed = False
-            for t in lm.get("types", []):
-                if t in type_map:
-                    categories[type_map[t]].append(lm)
-                    placed = True
-                    break
-            if not placed:
-                categories["Other attractions"].append(lm)
+            category = next(
+                (
+                    _LANDSCAPE_CATEGORY_BY_TYPE[t]
+                    for t in lm.get("types", [])
+                    if t in _LANDSCAPE_CATEGORY_BY_TYPE
+                ),
+                _LANDSCAPE_OTHER,
+            )
+            categories[category].append(lm)
 
         lines = [
             "## DESTINATION LANDSCAPE (from Google data)",
@@ -475,10 +507,7 @@ class GooglePlacesService:
                     for p in places[:3]
                 )
                 lines.append(f"- **{cat_name}**: {top}")
-
-        lines.append("")
-        lines.append("Use this landscape to set experience_themes and allocate days.")
-        lines.append("Do NOT copy specific attraction names — describe experience categories instead.")
+        lines.append(_LANDSCAPE_FOOTER)
 
         return "\n".join(lines)
 
@@ -754,7 +783,7 @@ class GooglePlacesService:
                 and c.user_ratings_total >= min_ratings_count
             )
             and (c.business_status is None or c.business_status not in _CLOSED_STATUSES)
-            and not any(t in LODGING_TYPES for t in c.types)
+            and LODGING_TYPES.isdisjoint(c.types)
         ]
 
         filtered.sort(
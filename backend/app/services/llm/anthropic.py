@@ -1,21 +1,32 @@
+import asyncio
 import logging
 from typing import Any, TypeVar
 
 import anthropic
 from pydantic import BaseModel, ValidationError
 
+from app.config.planning import LLM_API_MAX_RETRIES, LLM_REQUEST_TIMEOUT
+
 from .base import LLMService
 from .exceptions import LLMValidationError
 
 logger = logging.getLogger(__name__)
 
+# Transient Anthropic errors worth retrying
+_TRANSIENT_ERRORS = (anthropic.APITimeoutError, anthropic.APIConnectionError, anthropic.InternalServerError, anthropic.RateLimitError)
+_API_MAX_RETRIES = LLM_API_MAX_RETRIES
+_API_RETRY_BASE_DELAY = 2.0
+
 T = TypeVar("T", bound=BaseModel)
 
 
 class AnthropicLLMService(LLMService):
     def __init__(self, api_key: str, model: str) -> None:
         self.model = model
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key, timeout=LLM_REQUEST_TIMEOUT,
+            max_retries=0,  # transient errors are retried by _create_with_retry
+        )
 
     async def generate(
         self,
@@ -26,7 +37,7 @@ class AnthropicLLMService(LLMService):
     ) -> str:
         """Generate text response."""
         try:
-            response = await self.client.messages.create(
+            response = await self._create_with_retry(
                 model=self.model,
                 system=system_prompt,
                 messages=[{"role": "user", "content": user_prompt}],
@@ -64,7 +75,7 @@ class AnthropicLLMService(LLMService):
 
         for attempt in range(1 + max_retries):
             try:
-                response = await self.client.messages.create(
+                response = await self._create_with_retry(
                     model=self.model,
                     system=system_prompt,
                     messages=[{"role": "user", "content": user_prompt}],
@@ -113,7 +124,7 @@ class AnthropicLLMService(LLMService):
         """Generate text with Anthropic web search grounding."""
         from .base import SearchCitation
         try:
-            response = await self.client.messages.create(
+            response = await self._create_with_retry(
                 model=self.model,
                 system=system_prompt,
                 messages=[{"role": "user", "content": user_prompt}],
@@ -172,7 +183,7 @@ class AnthropicLLMService(LLMService):
 
         for attempt in range(1 + max_retries):
             try:
-                response = await self.client.messages.create(
+                response = await self._create_with_retry(
                     model=self.model,
                     system=system_prompt,
                     messages=[{"role": "user", "content": user_prompt}],
@@ -225,6 +236,20 @@ class AnthropicLLMService(LLMService):
 
         raise LLMValidationError(schema.__name__, last_errors, 1 + max_retries)
 
+    async def _create_with_retry(self, **kwargs: Any) -> Any:
+        """Call the Messages API with retry on transient errors."""
+        for attempt in range(_API_MAX_RETRIES + 1):
+            try:
+                return await self.client.messages.create(**kwargs)
+            except _TRANSIENT_ERRORS as e:
+                if attempt < _API_MAX_RETRIES:
+                    delay = _API_RETRY_BASE_DELAY * (2 ** attempt)
+                    logger.warning("Transient Anthropic error (attempt %d/%d), retrying in %.1fs: %s", attempt + 1, _API_MAX_RETRIES + 1, delay, e)
+                    await asyncio.sleep(delay)
+                    continue
+                raise
+        raise RuntimeError("Unreachable")
+
     async def close(self) -> None:
         """Cleanup resources."""
         await self.client.close()
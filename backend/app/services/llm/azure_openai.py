@@ -1,11 +1,12 @@
 import asyncio
-import json
 import logging
 from typing import Any, TypeVar
 
 import openai
 from pydantic import BaseModel, ValidationError
 
+from app.config.planning import LLM_API_MAX_RETRIES, LLM_REQUEST_TIMEOUT
+
 from .base import LLMService
 from .exceptions import LLMValidationError, LLMContentFilterError
 
@@ -13,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 # Transient OpenAI errors worth retrying
 _TRANSIENT_ERRORS = (openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError, openai.RateLimitError)
-_API_MAX_RETRIES = 2
+_API_MAX_RETRIES = LLM_API_MAX_RETRIES
 _API_RETRY_BASE_DELAY = 2.0
 
 
@@ -53,6 +54,8 @@ class AzureOpenAILLMService(LLMService):
             azure_endpoint=endpoint,
             api_key=api_key,
             api_version=api_version,
+            timeout=LLM_REQUEST_TIMEOUT,
+            max_retries=0,  # transient errors are retried by _call_with_retry
         )
         self._is_reasoning = any(
             deployment.lower().startswith(p) for p in _REASONING_MODEL_PREFIXES
@@ -137,8 +140,7 @@ class AzureOpenAILLMService(LLMService):
             try:
                 response = await self._call_with_retry(messages, params)
                 content = _sanitize_content(response.choices[0].message.content or "{}")
-                raw = json.loads(content)
-                return schema.model_validate(raw)
+                return schema.model_validate_json(content)
             except ValidationError as e:
                 last_errors = [str(err) for err in e.errors()]
                 logger.warning(
@@ -146,13 +148,6 @@ class AzureOpenAILLMService(LLMService):
                     attempt + 1, 1 + max_retries, e,
                 )
                 continue
-            except json.JSONDecodeError as e:
-                last_errors = [str(e)]
-                logger.warning(
-                    "JSON parse failed (attempt %d/%d): %s",
-                    attempt + 1, 1 + max_retries, e,
-                )
-                continue
             except openai.OpenAIError as e:
                 if _is_content_filter_error(e):
                     logger.warning("Azure content filter rejected structured request: %s", e)
@@ -232,8 +227,7 @@ class AzureOpenAILLMService(LLMService):
                 response = await self.client.responses.create(**params)
                 content = _sanitize_content(response.output_text or "{}")
                 citations = self._extract_response_citations(response)
-                raw = json.loads(content)
-                return (schema.model_validate(raw), citations)
+                return (schema.model_validate_json(content), citations)
             except ValidationError as e:
                 last_errors = [str(err) for err in e.errors()]
                 logger.warning(
@@ -241,13 +235,6 @@ class AzureOpenAILLMService(LLMService):
                     attempt + 1, 1 + max_retries, e,
                 )
                 continue
-            except json.JSONDecodeError as e:
-                last_errors = [str(e)]
-                logger.warning(
-                    "JSON parse failed (attempt %d/%d): %s",
-                    attempt + 1, 1 + max_retries, e,
-                )
-                continue
             except Exception as e:
                 if isinstance(e, openai.OpenAIError) and _is_content_filter_error(e):
                     raise LLMContentFilterError(e) from e
@@ -1,3 +1,5 @@
+import json
+import re
 from abc import ABC, abstractmethod
 from typing import Any, TypeVar
 
@@ -5,6 +7,42 @@ from pydantic import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
 
+_JSON_DECODER = json.JSONDecoder()
+_FENCE_RE = re.compile(r"```[\w-]*\s*(.*?)```", re.DOTALL)
+_JSON_START_RE = re.compile(r"[{\[]")
+
+
+def extract_json(text: str) -> Any:
+    """Parse the first JSON object/array embedded in raw LLM text.
+
+    Handles bare JSON, markdown code fences and surrounding prose. Fenced
+    blocks are tried first; otherwise decoding is attempted from each
+    successive ``{``/``[`` so brackets in leading prose (``"[2 days]"``)
+    are skipped. The end of the value is found by ``JSONDecoder.raw_decode``
+    (C-speed, respects braces inside strings).
+
+    Raises:
+        json.JSONDecodeError: If no JSON value can be decoded.
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    for fence in _FENCE_RE.finditer(text):
+        try:
+            return json.loads(fence.group(1))
+        except json.JSONDecodeError:
+            continue
+
+    for start in _JSON_START_RE.finditer(text):
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, start.start())
+        except json.JSONDecodeError:
+            continue
+        return obj
+    raise json.JSONDecodeError("No JSON object found", text, 0)
+
 
 class SearchCitation(BaseModel):
     """Normalized citation from any provider's web search."""
@@ -1,4 +1,3 @@
-import json
 import logging
 from typing import Any, TypeVar
 
@@ -6,6 +5,8 @@ from google import genai
 from google.genai import types
 from pydantic import BaseModel, ValidationError
 
+from app.config.planning import LLM_REQUEST_TIMEOUT
+
 from .base import LLMService
 from .exceptions import LLMValidationError
 
@@ -19,7 +20,11 @@ class GeminiLLMService(LLMService):
 
     def __init__(self, api_key: str, model: str) -> None:
         self.model = model
-        self.client = genai.Client(api_key=api_key)
+        self.client = genai.Client(
+            api_key=api_key,
+            # google-genai takes the timeout in milliseconds
+            http_options=types.HttpOptions(timeout=int(LLM_REQUEST_TIMEOUT * 1000)),
+        )
 
     async def generate(
         self,
@@ -77,8 +82,7 @@ class GeminiLLMService(LLMService):
                     ),
                 )
                 content = (response.text or "{}").replace("\x00", "")
-                raw = json.loads(content)
-                return schema.model_validate(raw)
+                return schema.model_validate_json(content)
             except ValidationError as e:
                 last_errors = [str(err) for err in e.errors()]
                 logger.warning(
@@ -86,13 +90,6 @@ class GeminiLLMService(LLMService):
                     attempt + 1, 1 + max_retries, e,
                 )
                 continue
-            except json.JSONDecodeError as e:
-                last_errors = [str(e)]
-                logger.warning(
-                    "JSON parse failed (attempt %d/%d): %s",
-                    attempt + 1, 1 + max_retries, e,
-                )
-                continue
             except Exception as e:
                 logger.error("Gemini generate_structured failed: %s", e)
                 raise
@@ -157,8 +154,7 @@ class GeminiLLMService(LLMService):
                 )
                 content = (response.text or "{}").replace("\x00", "")
                 all_citations = self._extract_citations(response)
-                raw = json.loads(content)
-                return (schema.model_validate(raw), all_citations)
+                return (schema.model_validate_json(content), all_citations)
             except ValidationError as e:
                 last_errors = [str(err) for err in e.errors()]
                 logger.warning(
@@ -166,13 +162,6 @@ class GeminiLLMService(LLMService):
                     attempt + 1, 1 + max_retries, e,
                 )
                 continue
-            except json.JSONDecodeError as e:
-                last_errors = [str(e)]
-                logger.warning(
-                    "JSON parse failed (attempt %d/%d): %s",
-                    attempt + 1, 1 + max_retries, e,
-                )
-                continue
             except Exception as e:
                 logger.warning("Gemini search+structured failed, falling back: %s", e)
                 result = await self.generate_structured(
@@ -46,8 +46,7 @@ class RefreshPipeline:
             return RefreshResult(city_id, False, 0, "No changes detected")
 
         # Compute turnover
-        existing_places = await self.place_repo.get_by_city(city_id)
-        existing_ids = {p.google_place_id for p in existing_places}
+        existing_ids = await self.place_repo.get_google_ids_by_city(city_id)
         new_ids = {
             c.get("google_place_id") or c.get("place_id")
             for c in result.candidates + result.lodging_candidates
@@ -101,6 +100,6 @@ class RefreshPipeline:
                 result = await self.check_city(city.id)
                 results.append(result)
             except Exception as e:
-                logger.error(f"Refresh failed for {city.name}: {e}")
+                logger.error("Refresh failed for %s: %s", city.name, e)
                 results.append(RefreshResult(city.id, False, 0, f"Error: {e}"))
         return results
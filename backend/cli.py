@@ -58,6 +58,25 @@ async def _queue_generate(
         logger.info("Queued job %s for %s (%s/%s/%dd)", job.id, city_name, pace, budget, days)
 
 
+async def _heartbeat_job(session_factory, job_id, worker_id: str) -> None:
+    """Keep a running job's lock fresh so recover_stale doesn't requeue it.
+
+    Uses its own session: the job's session is busy with the pipeline.
+    """
+    from app.config.planning import JOB_HEARTBEAT_INTERVAL_SECONDS
+    from app.db.repository import JobRepository
+
+    while True:
+        await asyncio.sleep(JOB_HEARTBEAT_INTERVAL_SECONDS)
+        try:
+            async with session_factory() as session:
+                if not await JobRepository(session).heartbeat(job_id, worker_id):
+                    logger.warning("Job %s no longer locked by %s, stopping heartbeat", job_id, worker_id)
+                    return
+        except Exception as e:
+            logger.warning("Heartbeat for job %s failed: %s", job_id, e)
+
+
 async def _run_worker(worker_id: str) -> None:
     import sys
     from app.config.settings import get_settings
@@ -129,6 +148,9 @@ async def _run_worker(worker_id: str) -> None:
                     day_plan_repo=day_plan_repo,
                 )
 
+                heartbeat = asyncio.create_task(
+                    _heartbeat_job(session_factory, job.id, worker_id)
+                )
                 try:
                     if job.job_type in ("batch_generate", "upgrade_draft"):
                         params = job.parameters or {}
@@ -152,6 +174,8 @@ async def _run_worker(worker_id: str) -> None:
                         await job_repo.fail(job.id, str(e)[:500])
                     except Exception:
                         logger.error("Failed to mark job as failed, will be recovered as stale")
+                finally:
+                    heartbeat.cancel()
 
         except Exception as e:
             logger.error("Worker loop error: %s", e)
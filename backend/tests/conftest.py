@@ -72,6 +72,21 @@ from app.main import create_app
 from app.services.llm.base import LLMService
 
 
+# ── Integration marker ─────────────────────────────────────────────────
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark every test that uses the DB-backed ``app`` fixture as
+    ``integration`` so it can be deselected with ``-m "not integration"``.
+
+    Deselecting only skips those tests: the container above is started at
+    import, so Docker is still required.
+    """
+    for item in items:
+        if "app" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.integration)
+
+
 # ── Mock LLM Service ───────────────────────────────────────────────────
 
 
@@ -171,9 +186,13 @@ def _get_test_session_factory():
     return _test_session_factory
 
 
-@pytest_asyncio.fixture(autouse=True)
+@pytest_asyncio.fixture
 async def _setup_db():
-    """Create tables before each test and drop them after."""
+    """Create tables before each test and drop them after.
+
+    Pulled in by the ``app`` fixture rather than autouse, so unit tests that
+    never touch the database skip the per-test DDL round-trips.
+    """
     global _test_engine, _test_session_factory
     # Reset engine per test to bind to the current event loop
     if _test_engine is not None:
@@ -238,7 +257,7 @@ async def _override_require_user(request: Request) -> dict:
 
 
 @pytest_asyncio.fixture
-async def app():
+async def app(_setup_db):
     """Create a fresh FastAPI app with dependency overrides for testing."""
     application = create_app()
 
@@ -1,5 +1,7 @@
 """Tests for the journey assembler module."""
 
+import copy
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4, UUID
@@ -11,6 +13,15 @@ from app.assembler.connector import CityConnector
 from app.assembler.assembler import JourneyAssembler
 
 
+# Three-city allocation shared by allocator and assembler tests. Tests that
+# hand it to code which may mutate it take a deepcopy.
+_JAPAN_ALLOCATIONS = (
+    {"name": "Tokyo", "country": "Japan", "day_count": 4, "order": 1},
+    {"name": "Kyoto", "country": "Japan", "day_count": 3, "order": 2},
+    {"name": "Osaka", "country": "Japan", "day_count": 3, "order": 3},
+)
+
+
 # ── CityAllocator ────────────────────────────────────────────────────
 
 
@@ -19,11 +30,7 @@ async def test_allocator_splits_days():
     """Mock LLM returns city allocations, verify total days match."""
     mock_llm = AsyncMock()
     mock_llm.generate_structured.return_value = CityAllocationOutput(
-        cities=[
-            {"name": "Tokyo", "country": "Japan", "day_count": 4, "order": 1},
-            {"name": "Kyoto", "country": "Japan", "day_count": 3, "order": 2},
-            {"name": "Osaka", "country": "Japan", "day_count": 3, "order": 3},
-        ]
+        cities=copy.deepcopy(list(_JAPAN_ALLOCATIONS))
     )
 
     allocator = CityAllocator(llm_service=mock_llm)
@@ -66,6 +73,8 @@ async def test_lookup_finds_variant():
     mock_city = MagicMock()
     mock_city.id = city_id
     mock_city.name = "Tokyo"
+    mock_city.country = "Japan"
+    mock_city.country_code = "JP"
 
     mock_variant = MagicMock()
     mock_variant.id = variant_id
@@ -100,6 +109,30 @@ async def test_lookup_city_not_found():
     variant_repo.lookup.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_lookup_ignores_same_name_city_in_other_country():
+    """'Paris, Texas' must not resolve to a stored Paris in France."""
+    mock_city = MagicMock()
+    mock_city.id = uuid4()
+    mock_city.name = "Paris"
+    mock_city.country = "France"
+    mock_city.country_code = "FR"
+
+    city_repo = AsyncMock()
+    city_repo.list.return_value = ([mock_city], 1)
+
+    variant_repo = AsyncMock()
+
+    lookup = VariantLookup(city_repo=city_repo, variant_repo=variant_repo)
+    result = await lookup.find(
+        "Paris, Texas", country="United States", pace="moderate", budget="moderate", day_count=3,
+    )
+
+    assert result.city_id is None
+    assert result.needs_generation is True
+    variant_repo.lookup.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_lookup_falls_back_to_draft():
     """When no published variant, falls back to draft."""
@@ -109,6 +142,8 @@ async def test_lookup_falls_back_to_draft():
     mock_city = MagicMock()
     mock_city.id = city_id
     mock_city.name = "Kyoto"
+    mock_city.country = "Japan"
+    mock_city.country_code = "JP"
 
     mock_variant = MagicMock()
     mock_variant.id = variant_id
@@ -128,6 +163,28 @@ async def test_lookup_falls_back_to_draft():
     assert variant_repo.lookup.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_lookup_matches_unnormalized_city_name():
+    """Case, whitespace and a country suffix don't prevent a match."""
+    mock_city = MagicMock()
+    mock_city.id = uuid4()
+    mock_city.name = "Tokyo"
+    mock_city.country = "Japan"
+    mock_city.country_code = "JP"
+
+    city_repo = AsyncMock()
+    city_repo.list.return_value = ([mock_city], 1)
+
+    variant_repo = AsyncMock()
+    variant_repo.lookup.return_value = MagicMock()
+
+    lookup = VariantLookup(city_repo=city_repo, variant_repo=variant_repo)
+    result = await lookup.find(" tokyo, Japan", country="Japan", pace="moderate", budget="moderate", day_count=3)
+
+    assert result.city_id == mock_city.id
+    assert result.needs_generation is False
+
+
 # ── CityConnector ────────────────────────────────────────────────────
 
 
@@ -259,3 +316,48 @@ async def test_assembler_generating_journey():
     assert result["job_ids"] == [str(job_id)]
     assert result["city_sequence"][0]["variant_id"] is None
     job_repo.create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_assembler_generating_multi_city_journey():
+    """Jobs for uncached cities carry that city's own allocation."""
+    allocator = AsyncMock()
+    allocator.allocate.return_value = copy.deepcopy(list(_JAPAN_ALLOCATIONS))
+
+    async def find(city_name, country, pace, budget, day_count):
+        cached = city_name == "Tokyo"
+        return LookupResult(
+            city_id=uuid4(), city_name=city_name.upper(),
+            variant_id=uuid4() if cached else None,
+            variant=MagicMock() if cached else None,
+            needs_generation=not cached,
+        )
+
+    lookup = AsyncMock()
+    lookup.find.side_effect = find
+
+    journey_repo = AsyncMock()
+    journey_repo.create.return_value = MagicMock(id=uuid4())
+    job_repo = AsyncMock()
+    job_repo.create.return_value = MagicMock(id=uuid4())
+
+    assembler = JourneyAssembler(
+        allocator=allocator, lookup=lookup, connector=AsyncMock(),
+        weather=AsyncMock(), journey_repo=journey_repo,
+        job_repo=job_repo, variant_repo=AsyncMock(),
+    )
+
+    result = await assembler.assemble(
+        user_id=uuid4(), destination="Japan", origin=None,
+        start_date=date(2026, 6, 1), total_days=10,
+        pace="moderate", budget="moderate",
+    )
+
+    assert result["status"] == "generating"
+    assert len(result["job_ids"]) == 2
+    params = [c.kwargs["parameters"] for c in job_repo.create.call_args_list]
+    assert [(p["city_name"], p["country"], p["day_count"]) for p in params] == [
+        ("KYOTO", "Japan", 3),
+        ("OSAKA", "Japan", 3),
+    ]
+    assert [c["start_day"] for c in result["city_sequence"]] == [1, 5, 8]
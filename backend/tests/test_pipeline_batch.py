@@ -1,5 +1,6 @@
 """Tests for batch pipeline and draft pipeline orchestration."""
 
+import asyncio
 import uuid
 from dataclasses import dataclass
 from datetime import time
@@ -254,6 +255,31 @@ async def test_batch_pipeline_progress_callback():
     assert progress_values == [5, 15, 25, 40, 55, 80, 90, 100]
 
 
+@pytest.mark.asyncio
+async def test_batch_pipeline_keeps_day_order_when_routing_finishes_out_of_order():
+    """Days routed concurrently are returned in curation order."""
+    pipeline = _build_batch_pipeline()
+    days = [
+        MagicMock(day_number=n, theme=f"Day {n}", theme_description="", activities=[])
+        for n in (1, 2, 3)
+    ]
+    curation = MagicMock(days=days)
+    delays = iter([0.03, 0.0, 0.01])
+
+    async def slow_route_day(activities, pace):
+        await asyncio.sleep(next(delays))
+        return _make_routing_result()
+
+    pipeline.routing.route_day = AsyncMock(side_effect=slow_route_day)
+
+    scheduled_days = await pipeline._route_and_schedule_days(
+        curation, _make_discovery_result(), {}, "Japan", "moderate"
+    )
+
+    assert [day.day_number for day, _, _ in scheduled_days] == [1, 2, 3]
+    assert pipeline.scheduling.schedule_day.call_count == 3
+
+
 # ---------------------------------------------------------------------------
 # Draft pipeline tests
 # ---------------------------------------------------------------------------
@@ -9,6 +9,7 @@ import pytest
 from app.models.common import Location
 from app.models.internal import PlaceCandidate
 from app.pipelines.discovery import DiscoveryPipeline, DiscoveryResult
+from app.services.google.places import GooglePlacesService
 
 
 def _make_candidate(
@@ -145,3 +146,73 @@ async def test_discover_computes_hash():
 
     assert result1.data_hash == result2.data_hash
     assert len(result1.data_hash) == 64  # SHA-256 hex length
+
+
+@pytest.mark.asyncio
+async def test_discover_lodging_tolerates_failed_query():
+    """A failing lodging query doesn't drop results from the others."""
+    svc = _mock_places_service()
+    svc.search_lodging.side_effect = [
+        _make_lodging_candidate("hotel_1", "Park Hyatt"),
+        RuntimeError("quota exceeded"),
+        _make_lodging_candidate("hostel_1", "Nui Hostel"),
+    ]
+
+    pipeline = DiscoveryPipeline(svc)
+    result = await pipeline.discover("Tokyo")
+
+    lodging_ids = [c["place_id"] for c in result.lodging_candidates]
+    assert lodging_ids == ["hotel_1", "hostel_1"]
+
+
+@pytest.mark.asyncio
+async def test_geocode_is_cached_per_query():
+    """Repeated geocodes of the same city only hit the API once."""
+    resp = MagicMock()
+    resp.json.return_value = {
+        "places": [{
+            "displayName": {"text": "Tokyo"},
+            "id": "geo_tokyo",
+            "location": {"latitude": 35.6762, "longitude": 139.6503},
+            "addressComponents": [],
+            "utcOffsetMinutes": 540,
+        }]
+    }
+    client = AsyncMock()
+    client.post.return_value = resp
+    svc = GooglePlacesService("key", client)
+
+    first = await svc.geocode("Tokyo")
+    first["name"] = "mutated"
+    second = await svc.geocode("  tokyo ")
+
+    assert client.post.await_count == 1
+    assert second["name"] == "Tokyo"
+    assert second["place_id"] == "geo_tokyo"
+
+
+@pytest.mark.asyncio
+async def test_sparse_discovery_expands_radius_in_parallel():
+    """Sparse results trigger a 15km re-search whose batches are merged and deduplicated."""
+    svc = GooglePlacesService("key", AsyncMock())
+    expanded_calls = 0
+
+    async def fake_nearby(location, included_types, radius_meters, max_results=20, **kwargs):
+        nonlocal expanded_calls
+        if radius_meters != 15000:
+            return []
+        expanded_calls += 1
+        if expanded_calls == 2:
+            raise RuntimeError("quota exceeded")
+        return [
+            _make_candidate("shared"),
+            _make_candidate(f"batch_{'_'.join(included_types)}"),
+        ]
+
+    svc._nearby_search = fake_nearby
+    places = await svc.discover_places(Location(lat=35.6762, lng=139.6503), ["culture"])
+
+    ids = [p.place_id for p in places]
+    assert expanded_calls > 2
+    assert ids.count("shared") == 1
+    assert len(ids) == expanded_calls  # one shared + one per successful batch
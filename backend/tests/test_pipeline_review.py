@@ -133,3 +133,42 @@ async def test_collect_used_ids():
         ]
     }
     assert pipeline._collect_used_ids(plan2) == {"gp_x"}
+
+
+@pytest.mark.asyncio
+async def test_fix_parses_fenced_json_with_braces_in_strings():
+    """Fixer output wrapped in prose/code fences is still parsed."""
+    fixed = _sample_plan()
+    fixed["days"][0]["theme"] = "Tokyo {old} & {new}"
+    raw = "Here is the fixed plan:\n```json\n" + json.dumps(fixed) + "\n```\nDone."
+    llm = _make_mock_llm([], fix_response=raw)
+    pipeline = ReviewPipeline(llm)
+
+    result = await pipeline.fix(
+        plan=_sample_plan(),
+        issues=["issue"],
+        candidates=[],
+        already_used=set(),
+        city_name="Tokyo",
+    )
+
+    assert result == fixed
+
+
+@pytest.mark.asyncio
+async def test_fix_skips_brackets_in_leading_prose():
+    """A bracket in the prose before the fenced JSON doesn't break parsing."""
+    fixed = _sample_plan()
+    raw = "Here is the plan [2 days]:\n```json\n" + json.dumps(fixed) + "\n```"
+    llm = _make_mock_llm([], fix_response=raw)
+    pipeline = ReviewPipeline(llm)
+
+    result = await pipeline.fix(
+        plan={"days": []},
+        issues=["issue"],
+        candidates=[],
+        already_used=set(),
+        city_name="Tokyo",
+    )
+
+    assert result == fixed
@@ -93,6 +93,10 @@ async def test_tsp_optimize_order():
     seqs = [a["sequence"] for a in result.ordered_activities]
     assert seqs == [1, 2, 3]
 
+    # Input dicts are left untouched
+    assert [a["sequence"] for a in activities] == [1, 2, 3]
+    assert result.ordered_activities[0] is activities[0]
+
 
 @pytest.mark.asyncio
 async def test_route_fallback_on_error():
@@ -114,3 +118,56 @@ async def test_route_fallback_on_error():
     assert route.distance_meters == 800
     assert route.duration_seconds == 720
     assert route.polyline is None
+
+
+@pytest.mark.asyncio
+async def test_short_hop_skips_routes_api():
+    """Activities a few hundred metres apart are walked without an API call."""
+    svc = _mock_routes_service()
+    pipeline = RoutingPipeline(svc)
+
+    # ~220 m apart in central Tokyo
+    activities = [
+        _make_activity(1, 35.6586, 139.7454, "Tokyo Tower"),
+        _make_activity(2, 35.6606, 139.7454, "Shiba Park"),
+    ]
+
+    result = await pipeline.route_day(activities)
+
+    svc.compute_best_route.assert_not_called()
+    route = result.routes[0]
+    assert route.travel_mode == "walk"
+    assert 250 < route.distance_meters < 320
+    assert route.duration_seconds > 0
+    assert route.polyline is None
+
+
+@pytest.mark.asyncio
+async def test_missing_locations_not_treated_as_short_hop():
+    """Two activities without coordinates (0, 0) are not a zero-length walk."""
+    svc = _mock_routes_service()
+    pipeline = RoutingPipeline(svc)
+
+    activities = [_make_activity(1, 0, 0), _make_activity(2, 0, 0)]
+
+    await pipeline.route_day(activities)
+
+    svc.compute_best_route.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_repeated_route_uses_cache():
+    """Routing the same activities again doesn't call the Routes API."""
+    svc = _mock_routes_service()
+    pipeline = RoutingPipeline(svc)
+
+    activities = [
+        _make_activity(1, 35.6762, 139.6503, "Shinjuku"),
+        _make_activity(2, 35.6586, 139.7454, "Tokyo Tower"),
+    ]
+
+    first = await pipeline.route_day(activities)
+    second = await pipeline.route_day(activities)
+
+    assert svc.compute_best_route.call_count == 1
+    assert second.routes == first.routes
@@ -10,6 +10,7 @@ from app.algorithms.quality.evaluators import (
     OpeningHoursEvaluator,
     ThemeAlignmentEvaluator,
     DurationAppropriatenessEvaluator,
+    _grade_from_score as _evaluator_grade_from_score,
 )
 from app.models.common import Location, TravelMode
 from app.models.day_plan import Activity, DayPlan, Place, Route
@@ -26,16 +27,20 @@ def _make_activity(
     route_to_next: Route | None = None,
     opening_hours: list[str] | None = None,
 ) -> Activity:
-    """Helper to create an Activity."""
-    return Activity(
+    """Helper to create an Activity.
+
+    Inputs are already well-typed, so the models are built with
+    ``model_construct`` and skip validation.
+    """
+    return Activity.model_construct(
         time_start=time_start,
         time_end=time_end,
         duration_minutes=duration,
-        place=Place(
+        place=Place.model_construct(
             place_id=f"place_{name.replace(' ', '_')}",
             name=name,
             address=f"{name} address",
-            location=Location(lat=lat, lng=lng),
+            location=Location.model_construct(lat=lat, lng=lng),
             category=category,
             opening_hours=opening_hours or [],
         ),
@@ -50,8 +55,8 @@ def _make_day(
     date: str = "2026-03-04",
     city_name: str = "Paris",
 ) -> DayPlan:
-    """Helper to create a DayPlan."""
-    return DayPlan(
+    """Helper to create a DayPlan (unvalidated, see ``_make_activity``)."""
+    return DayPlan.model_construct(
         date=date,
         day_number=day_number,
         theme=theme,
@@ -78,52 +83,93 @@ def _make_good_day() -> DayPlan:
     )
 
 
+# Built once at import: evaluators only read day plans, so the read-only
+# tests share this instead of re-validating the same models each time.
+_GOOD_DAY = _make_good_day()
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Grade helpers
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_GRADE_CASES = (
+    (100, "A"),
+    (95, "A"),
+    (90, "A"),
+    (89.9, "A-"),
+    (85, "A-"),
+    (80, "B+"),
+    (75, "B"),
+    (70, "B-"),
+    (65, "C+"),
+    (60, "C"),
+    (59.9, "D"),
+    (50, "D"),
+    (0, "D"),
+)
+
+
 class TestGradeFromScore:
-    def test_a_grade(self):
-        assert _grade_from_score(95) == "A"
+    @pytest.mark.parametrize("score,expected", _GRADE_CASES)
+    def test_grade_thresholds(self, score, expected):
+        assert _grade_from_score(score) == expected
+
+
+_EVALUATOR_GRADE_CASES = (
+    (100, "A+"),
+    (95, "A+"),
+    (94.9, "A"),
+    (90, "A"),
+    (85, "A-"),
+    (80, "B+"),
+    (75, "B"),
+    (70, "B-"),
+    (65, "C+"),
+    (60, "C"),
+    (55, "C-"),
+    (50, "D"),
+    (49.9, "F"),
+    (0, "F"),
+)
 
-    def test_b_grade(self):
-        assert _grade_from_score(75) == "B"
 
-    def test_d_grade(self):
-        assert _grade_from_score(50) == "D"
+class TestEvaluatorGradeFromScore:
+    @pytest.mark.parametrize("score,expected", _EVALUATOR_GRADE_CASES)
+    def test_grade_thresholds(self, score, expected):
+        assert _evaluator_grade_from_score(score) == expected
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ItineraryScorer
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@pytest.fixture(scope="module")
+def scorer() -> ItineraryScorer:
+    """Evaluators are stateless, so one scorer serves the whole module."""
+    return ItineraryScorer()
+
+
 class TestItineraryScorer:
-    def test_empty_day_plans(self):
-        scorer = ItineraryScorer()
+    def test_empty_day_plans(self, scorer):
         report = scorer.evaluate([])
         assert report.overall_score is not None
         assert report.overall_grade is not None
 
-    def test_good_day_gets_decent_score(self):
-        scorer = ItineraryScorer()
-        report = scorer.evaluate([_make_good_day()])
+    def test_good_day_gets_decent_score(self, scorer):
+        report = scorer.evaluate([_GOOD_DAY])
         assert report.overall_score >= 40  # Should be decent
 
-    def test_has_all_7_metrics(self):
-        scorer = ItineraryScorer()
-        report = scorer.evaluate([_make_good_day()])
+    def test_has_all_7_metrics(self, scorer):
+        report = scorer.evaluate([_GOOD_DAY])
         assert len(report.metrics) == 7
 
-    def test_quick_score_returns_tuple(self):
-        scorer = ItineraryScorer()
-        score, grade = scorer.get_quick_score([_make_good_day()])
+    def test_quick_score_returns_tuple(self, scorer):
+        score, grade = scorer.get_quick_score([_GOOD_DAY])
         assert isinstance(score, float)
         assert isinstance(grade, str)
 
-    def test_weights_sum_to_one(self):
-        scorer = ItineraryScorer()
-        total_weight = sum(ev.weight for ev in scorer.evaluators)
-        assert total_weight == pytest.approx(1.0)
+    def test_weights_sum_to_one(self, scorer):
+        assert scorer.total_weight == pytest.approx(1.0)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -131,208 +177,226 @@ class TestItineraryScorer:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class TestMealTimingEvaluator:
-    def test_empty(self):
-        ev = MealTimingEvaluator()
-        result = ev.evaluate([])
+    @pytest.fixture(scope="module")
+    def evaluator(self) -> MealTimingEvaluator:
+        return MealTimingEvaluator()
+
+    def test_empty(self, evaluator):
+        result = evaluator.evaluate([])
         assert result.score == 0
 
-    def test_day_with_proper_meals(self):
-        ev = MealTimingEvaluator()
-        day = _make_good_day()  # Has lunch at 12:30 and dinner at 18:30
-        result = ev.evaluate([day])
+    def test_day_with_proper_meals(self, evaluator):
+        day = _GOOD_DAY  # Has lunch at 12:30 and dinner at 18:30
+        result = evaluator.evaluate([day])
         assert result.score > 50
 
-    def test_day_without_meals(self):
-        ev = MealTimingEvaluator()
+    def test_day_without_meals(self, evaluator):
         day = _make_day(1, [
             _make_activity("Museum", "museum", "09:00", "11:00", 120),
             _make_activity("Park", "park", "11:30", "13:00", 90),
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert "No lunch" in result.issues[0] or "No dinner" in result.issues[0]
 
 
 class TestGeographicClusteringEvaluator:
-    def test_empty(self):
-        ev = GeographicClusteringEvaluator()
-        result = ev.evaluate([])
+    @pytest.fixture(scope="module")
+    def evaluator(self) -> GeographicClusteringEvaluator:
+        return GeographicClusteringEvaluator()
+
+    def test_empty(self, evaluator):
+        result = evaluator.evaluate([])
         assert result.score == 100
 
-    def test_clustered_activities(self):
-        ev = GeographicClusteringEvaluator()
+    def test_clustered_activities(self, evaluator):
         day = _make_day(1, [
             _make_activity("A", "museum", "09:00", "10:00", 60, lat=48.860, lng=2.337),
             _make_activity("B", "park", "10:30", "11:30", 60, lat=48.861, lng=2.338),
             _make_activity("C", "cafe", "12:00", "13:00", 60, lat=48.859, lng=2.336),
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert result.score >= 80  # Close together
 
-    def test_scattered_activities_penalized(self):
-        ev = GeographicClusteringEvaluator()
+    def test_scattered_activities_penalized(self, evaluator):
         day = _make_day(1, [
             _make_activity("A", "museum", "09:00", "10:00", 60, lat=48.0, lng=2.0),
             _make_activity("B", "park", "10:30", "11:30", 60, lat=49.0, lng=3.0),
             _make_activity("C", "cafe", "12:00", "13:00", 60, lat=47.0, lng=1.0),
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert result.score < 80  # Spread far apart
 
+    def test_backtracking_detected(self, evaluator):
+        day = _make_day(1, [
+            _make_activity("A", "museum", "09:00", "10:00", 60, lat=48.860, lng=2.300),
+            _make_activity("B", "park", "10:30", "11:30", 60, lat=48.860, lng=2.340),
+            _make_activity("C", "cafe", "12:00", "13:00", 60, lat=48.861, lng=2.301),
+        ])
+        result = evaluator.evaluate([day])
+        assert any("backtracking" in issue for issue in result.issues)
+
 
 class TestTravelEfficiencyEvaluator:
-    def test_empty(self):
-        ev = TravelEfficiencyEvaluator()
-        result = ev.evaluate([])
+    @pytest.fixture(scope="module")
+    def evaluator(self) -> TravelEfficiencyEvaluator:
+        return TravelEfficiencyEvaluator()
+
+    def test_empty(self, evaluator):
+        result = evaluator.evaluate([])
         assert result.score == 100
 
-    def test_short_travel_times(self):
-        ev = TravelEfficiencyEvaluator()
+    def test_short_travel_times(self, evaluator):
         day = _make_day(1, [
             _make_activity("A", "museum", "09:00", "10:00", 60,
                            route_to_next=Route(distance_meters=500, duration_seconds=300)),
             _make_activity("B", "park", "10:30", "11:30", 60),
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert result.score >= 90
 
-    def test_long_travel_penalized(self):
-        ev = TravelEfficiencyEvaluator()
+    def test_long_travel_penalized(self, evaluator):
         day = _make_day(1, [
             _make_activity("A", "museum", "09:00", "10:00", 60,
                            route_to_next=Route(distance_meters=50000, duration_seconds=3600)),
             _make_activity("B", "park", "11:00", "12:00", 60),
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert result.score < 90
 
 
 class TestVarietyEvaluator:
-    def test_empty(self):
-        ev = VarietyEvaluator()
-        result = ev.evaluate([])
+    @pytest.fixture(scope="module")
+    def evaluator(self) -> VarietyEvaluator:
+        return VarietyEvaluator()
+
+    def test_empty(self, evaluator):
+        result = evaluator.evaluate([])
         assert result.score == 100
 
-    def test_diverse_activities(self):
-        ev = VarietyEvaluator()
+    def test_diverse_activities(self, evaluator):
         day = _make_day(1, [
             _make_activity("Museum", "museum", "09:00", "10:00", 60),
             _make_activity("Lunch", "restaurant", "12:00", "13:00", 60),
             _make_activity("Park", "park", "14:00", "15:00", 60),
             _make_activity("Temple", "tourist_attraction", "16:00", "17:00", 60),
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert result.score >= 70
 
-    def test_repetitive_penalized(self):
-        ev = VarietyEvaluator()
+    def test_repetitive_penalized(self, evaluator):
         day = _make_day(1, [
             _make_activity("Museum A", "museum", "09:00", "10:00", 60),
             _make_activity("Museum B", "museum", "10:30", "11:30", 60),
             _make_activity("Museum C", "museum", "12:00", "13:00", 60),
             _make_activity("Museum D", "museum", "14:00", "15:00", 60),
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert any("repetitive" in issue.lower() for issue in result.issues)
 
 
 class TestOpeningHoursEvaluator:
-    def test_empty(self):
-        ev = OpeningHoursEvaluator()
-        result = ev.evaluate([])
+    @pytest.fixture(scope="module")
+    def evaluator(self) -> OpeningHoursEvaluator:
+        return OpeningHoursEvaluator()
+
+    def test_empty(self, evaluator):
+        result = evaluator.evaluate([])
         assert result.score == 100
 
-    def test_no_opening_hours_is_unknown(self):
-        ev = OpeningHoursEvaluator()
+    def test_no_opening_hours_is_unknown(self, evaluator):
         day = _make_day(1, [
             _make_activity("A", "museum", "09:00", "10:00", 60),
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert result.score == 100  # Unknown counts as valid
 
 
 class TestThemeAlignmentEvaluator:
-    def test_empty(self):
-        ev = ThemeAlignmentEvaluator()
-        result = ev.evaluate([])
+    @pytest.fixture(scope="module")
+    def evaluator(self) -> ThemeAlignmentEvaluator:
+        return ThemeAlignmentEvaluator()
+
+    def test_empty(self, evaluator):
+        result = evaluator.evaluate([])
         assert result.score == 100
 
-    def test_matching_theme(self):
-        ev = ThemeAlignmentEvaluator()
+    def test_matching_theme(self, evaluator):
         day = _make_day(1, theme="Heritage & Culture", activities=[
             _make_activity("Old Fort", "fort", "09:00", "11:00", 120),
             _make_activity("Lunch", "restaurant", "12:00", "13:00", 60),
             _make_activity("National Museum", "museum", "14:00", "16:00", 120),
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert result.score >= 50
 
-    def test_mismatched_theme(self):
-        ev = ThemeAlignmentEvaluator()
+    def test_mismatched_theme(self, evaluator):
         day = _make_day(1, theme="Nature & Parks", activities=[
             _make_activity("Shopping Mall A", "shopping", "09:00", "11:00", 120),
             _make_activity("Lunch", "restaurant", "12:00", "13:00", 60),
             _make_activity("Shopping Mall B", "shopping", "14:00", "16:00", 120),
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         # Shopping doesn't match nature theme
         assert result.score < 100
 
 
 class TestDurationAppropriatenessEvaluator:
-    def test_empty(self):
-        ev = DurationAppropriatenessEvaluator()
-        result = ev.evaluate([])
+    @pytest.fixture(scope="module")
+    def evaluator(self) -> DurationAppropriatenessEvaluator:
+        return DurationAppropriatenessEvaluator()
+
+    def test_empty(self, evaluator):
+        result = evaluator.evaluate([])
         assert result.score == 100
 
-    def test_appropriate_durations(self):
-        ev = DurationAppropriatenessEvaluator()
+    def test_appropriate_durations(self, evaluator):
         day = _make_day(1, [
             _make_activity("Museum", "museum", "09:00", "11:00", 120),  # 90-180 range
             _make_activity("Lunch", "restaurant", "12:00", "13:00", 60),  # 45-90 range
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert result.score >= 80
 
-    def test_unrealistic_duration_flagged(self):
-        ev = DurationAppropriatenessEvaluator()
+    def test_unrealistic_duration_flagged(self, evaluator):
         day = _make_day(1, [
             _make_activity("Museum", "museum", "09:00", "17:00", 500),  # >480 min
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert any("unrealistic" in i.lower() for i in result.issues)
 
-    def test_too_short_flagged(self):
-        ev = DurationAppropriatenessEvaluator()
+    def test_too_short_flagged(self, evaluator):
         day = _make_day(1, [
             _make_activity("Museum", "museum", "09:00", "09:10", 10),  # <15 min
         ])
-        result = ev.evaluate([day])
+        result = evaluator.evaluate([day])
         assert any("too short" in i.lower() for i in result.issues)
 
 
 class TestOpeningHoursEndTimeCheck:
     """Tests that evaluator checks activity END time, not just start."""
 
-    def test_activity_ending_after_close_flagged(self):
+    @pytest.fixture(scope="module")
+    def evaluator(self) -> OpeningHoursEvaluator:
+        return OpeningHoursEvaluator()
+
+    def test_activity_ending_after_close_flagged(self, evaluator):
         """Activity starting within hours but ending after close should be flagged."""
         act = _make_activity(
             "Museum", "museum", "15:30", "17:30", 120,  # 15:30 + 120min = 17:30
             opening_hours=["Wed: 09:00 \u2013 17:00"],
         )
         day = _make_day(1, [act], date="2026-04-15")  # Wednesday
-        evaluator = OpeningHoursEvaluator()
         result = evaluator.evaluate([day])
         assert result.issues, "Should flag activity ending after 17:00 close"
         assert any("17:00" in issue for issue in result.issues)
 
-    def test_activity_fitting_within_hours_not_flagged(self):
+    def test_activity_fitting_within_hours_not_flagged(self, evaluator):
         """Activity fully within opening hours should not be flagged."""
         act = _make_activity(
             "Museum", "museum", "14:00", "15:30", 90,  # 14:00 + 90min = 15:30
             opening_hours=["Wed: 09:00 \u2013 17:00"],
         )
         day = _make_day(1, [act], date="2026-04-15")  # Wednesday
-        evaluator = OpeningHoursEvaluator()
         result = evaluator.evaluate([day])
         opening_issues = [i for i in result.issues if "close" in i.lower() or "17:00" in i]
         assert not opening_issues, "Should not flag activity that fits within hours"
@@ -214,6 +214,8 @@ async def test_get_places_by_city(db_session: AsyncSession):
     assert len(lodging) == 1
     assert lodging[0].name == "Hilton"
 
+    assert await place_repo.get_google_ids_by_city(city.id) == {"gp_temple", "gp_hotel"}
+
 
 # ── Variant tests ────────────────────────────────────────────────────
 
@@ -318,6 +320,22 @@ async def test_recover_stale_jobs(db_session: AsyncSession):
     assert recovered.locked_by is None
 
 
+@pytest.mark.asyncio
+async def test_heartbeat_keeps_running_job_fresh(db_session: AsyncSession):
+    repo = JobRepository(db_session)
+    await repo.create(job_type="test_job")
+    picked = await repo.pick_next("worker-1")
+
+    picked.locked_at = datetime.now(timezone.utc) - timedelta(minutes=20)
+    await db_session.commit()
+
+    assert await repo.heartbeat(picked.id, "worker-2") is False
+    assert await repo.heartbeat(picked.id, "worker-1") is True
+
+    count = await repo.recover_stale(timeout_minutes=15)
+    assert count == 0
+
+
 # ── Journey tests ────────────────────────────────────────────────────
 
 
@@ -1,7 +1,14 @@
 """Unit tests for TSP route optimizer."""
 
 import pytest
-from app.algorithms.tsp import RouteOptimizer, haversine_distance, simple_optimize_by_location
+from app.algorithms.tsp import (
+    RouteOptimizer,
+    equirectangular_matrix,
+    fast_distance,
+    haversine_distance,
+    haversine_matrix,
+    simple_optimize_by_location,
+)
 from app.models.common import Location
 from app.models.internal import PlaceCandidate
 
@@ -29,7 +36,7 @@ class TestHaversineDistance:
         paris = Location(lat=48.8566, lng=2.3522)
         london = Location(lat=51.5074, lng=-0.1278)
         distance = haversine_distance(paris, london)
-        assert 340_000 < distance < 350_000  # within 5km tolerance
+        assert distance == pytest.approx(344_000, abs=5_000)
 
     def test_symmetry(self):
         a = Location(lat=40.7128, lng=-74.0060)  # NYC
@@ -41,7 +48,41 @@ class TestHaversineDistance:
         north = Location(lat=90, lng=0)
         south = Location(lat=-90, lng=0)
         distance = haversine_distance(north, south)
-        assert 20_000_000 < distance < 20_100_000
+        assert distance == pytest.approx(20_015_000, rel=1e-3)
+
+    def test_matrix_matches_pairwise(self):
+        locs = [
+            Location(lat=48.8566, lng=2.3522),   # Paris
+            Location(lat=51.5074, lng=-0.1278),  # London
+            Location(lat=52.5200, lng=13.4050),  # Berlin
+        ]
+        matrix = haversine_matrix(locs)
+        for i, a in enumerate(locs):
+            assert matrix[i][i] == 0.0
+            assert matrix[i] == pytest.approx([haversine_distance(a, b) for b in locs])
+
+    def test_fast_distance_close_to_haversine_within_city(self):
+        # Eiffel Tower to Notre-Dame, ~4 km apart
+        a = Location(lat=48.8584, lng=2.2945)
+        b = Location(lat=48.8530, lng=2.3499)
+        assert fast_distance(a, b) == pytest.approx(haversine_distance(a, b), rel=1e-3)
+
+    def test_equirectangular_matrix_matches_fast_distance(self):
+        locs = [
+            Location(lat=48.8584, lng=2.2945),
+            Location(lat=48.8530, lng=2.3499),
+            Location(lat=48.8606, lng=2.3376),
+        ]
+        matrix = equirectangular_matrix(locs)
+        for a, row in zip(locs, matrix):
+            assert row == pytest.approx([fast_distance(a, b) for b in locs])
+
+    def test_fast_distance_wraps_antimeridian(self):
+        # 0.2° of longitude apart across the dateline, ~22 km at the equator
+        a = Location(lat=0.0, lng=179.9)
+        b = Location(lat=0.0, lng=-179.9)
+        assert fast_distance(a, b) == pytest.approx(haversine_distance(a, b), rel=1e-3)
+        assert equirectangular_matrix([a, b])[0][1] == pytest.approx(22_239, rel=1e-3)
 
 
 class TestRouteOptimizer: